@@ -1,6 +1,9 @@
-import json
+import asyncio
+import logging
 import os
-from typing import Literal
+from typing import Literal, Set
+
+import orjson
 
 from backend.prompts.pedieat_prompts import (
     get_pedieat_prompt
@@ -11,6 +14,8 @@ from backend.prompts.chomps_prompts import (
 from config import config
 
 
+logger = logging.getLogger(__name__)
+
 
 PromptType = Literal['chomps', 'pedieat']
 
@@ -30,24 +35,63 @@ async def get_prompt(*, prompt_type: PromptType, data: str, json_format: bool =
 
 async def save_response(data: str , /, *,file_name: PromptType, json_format: bool = False):
     """
-    Save the response to a file. Data must be json parsed.
+    Save the response to a file.
+    The file write runs in a worker thread so the event loop is never blocked on disk I/O.
     Args:
-        data: The data to save.
+        data: The data to save. Must be json parsed when json_format is True, raw text otherwise.
         file_name: The name of the file to save.
-        json_format: Whether to save the prompt in JSON format.
+        json_format: Whether to save the data in JSON format.
     Returns:
         None
     """
     if json_format:
-        prompt = await PromptDict[file_name](data, json_format)
         file_name = os.path.join(config.get_ai_save_response_dir(), f"{file_name}_response.json")
-        with open(file_name, 'w') as f:
-            f.write(json.dumps(data, indent=4))
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
     else:
-        prompt = await PromptDict[file_name](data)
         file_name = os.path.join(config.get_ai_save_response_dir(), f"{file_name}_response.txt")
-        with open(file_name, 'w') as f:
-            f.write(prompt)
+        payload = data.encode()
+    await asyncio.to_thread(_write_file, file_name, payload)
+
+
+def _write_file(path: str, payload: bytes) -> None:
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+
+# Strong references to in-flight background saves so they are not garbage collected
+_pending_saves: Set[asyncio.Task] = set()
+
+
+def save_response_in_background(data: str, /, *, file_name: PromptType, json_format: bool = False) -> asyncio.Task:
+    """
+    Schedule save_response as a background task so the caller does not wait on disk I/O.
+    Failures are logged instead of propagated.
+    Args:
+        data: The data to save.
+        file_name: The name of the file to save.
+        json_format: Whether to save the data in JSON format.
+    Returns:
+        The scheduled task.
+    """
+    task = asyncio.create_task(save_response(data, file_name=file_name, json_format=json_format))
+    _pending_saves.add(task)
+    task.add_done_callback(_on_save_done)
+    return task
+
+
+async def flush_pending_saves() -> None:
+    """
+    Wait for every in-flight background save to finish, writing them concurrently.
+    Failures are already logged by the done callback, so they are not re-raised here.
+    """
+    if _pending_saves:
+        await asyncio.gather(*_pending_saves, return_exceptions=True)
+
+
+def _on_save_done(task: asyncio.Task) -> None:
+    _pending_saves.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"❌ Failed to save AI response: {task.exception()}")
 
 
 async def remove_lang_tags(data: str) -> str:
@@ -58,4 +102,8 @@ async def remove_lang_tags(data: str) -> str:
     Returns:
         The data with the language tags removed.
     """
+    # Common case: a single fence wrapping the whole response
+    text = data.strip().removeprefix("```json").removeprefix("```").removesuffix("```")
+    if "```" not in text:
+        return text
     return data.replace("```json", "").replace("```", "")
\ No newline at end of file
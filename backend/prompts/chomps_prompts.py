@@ -3,8 +3,6 @@ async def get_chomps_prompt(chomps_analysis: str, json_format=False) -> str:
         prompt = f"""
         Write a detailed ChOMPS assessment interpretation for a pediatric OT report.
 
-        ChOMPS Analysis: {chomps_analysis}
-
         Output Format:
         - Return the output as a valid JSON array of objects.
         - Each object must include:
@@ -43,13 +41,14 @@ async def get_chomps_prompt(chomps_analysis: str, json_format=False) -> str:
                 "content": "Interpretation..."
             }},
         }}
+
+        ChOMPS Analysis: {chomps_analysis}
         """
+        return prompt
     
     prompt = f"""
     Write a detailed ChOMPS assessment interpretation for a pediatric OT report.
     
-    ChOMPS Analysis: {chomps_analysis}
-    
     Requirements:
     - Report domain-specific scores and levels of concern
     - Describe feeding risks including bolus control, gagging, and food hoarding
@@ -61,5 +60,7 @@ async def get_chomps_prompt(chomps_analysis: str, json_format=False) -> str:
     - Connect findings to functional feeding abilities
     
     Focus on feeding safety, efficiency, and recommendations for intervention.
+    
+    ChOMPS Analysis: {chomps_analysis}
     """
     return prompt
\ No newline at end of file
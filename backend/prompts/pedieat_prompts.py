@@ -3,8 +3,6 @@ async def get_pedieat_prompt(pedieat_analysis: str, json_format=False) -> str:
         pedieat_prompt = f"""
         Write a detailed PediEAT assessment interpretation for a pediatric OT report.
 
-        PediEAT Analysis: {pedieat_analysis}
-
         Output Requirements:
         - Format the output as a valid JSON object.
         - Each section must include a "type" key specifying the content type: "header", "paragraph", or "bullet_points".
@@ -33,14 +31,14 @@ async def get_pedieat_prompt(pedieat_analysis: str, json_format=False) -> str:
                 "content": "The PediEAT assessment did not indicate any elevated symptoms in the domain of physiology. This suggests that the child does not exhibit significant physiological challenges such as dysphagia, oral-motor dysfunction, or other related issues that would impede the mechanical aspects of feeding. The absence of physiological concerns supports functional oral intake without apparent physical barriers."
             }},
         }}
+
+        PediEAT Analysis: {pedieat_analysis}
         """
         return pedieat_prompt
     
     pedieat_prompt = f"""
     Write a detailed PediEAT assessment interpretation for a pediatric OT report.
     
-    PediEAT Analysis: {pedieat_analysis}
-    
     Requirements:
     - Interpret elevated symptoms in Physiology, Processing, Mealtime Behavior, and Selectivity domains
     - Identify safety and endurance concerns during meals
@@ -52,5 +50,7 @@ async def get_pedieat_prompt(pedieat_analysis: str, json_format=False) -> str:
     - Connect findings to functional mealtime participation
     
     Focus on comprehensive feeding assessment and family-centered intervention planning.
+    
+    PediEAT Analysis: {pedieat_analysis}
     """
     return pedieat_prompt
\ No newline at end of file
@@ -0,0 +1,194 @@
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import orjson
+
+
+logger = logging.getLogger(__name__)
+
+# In-process tier in front of the disk cache, so repeat prompts within a session skip file IO
+_MEMORY_CACHE_SIZE = 128
+_memory_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+# Entries are patient narratives in plaintext, so the disk tier is bounded and swept rather than
+# left to grow; the oldest files go first once the cap is reached
+_MAX_DISK_ENTRIES = 1000
+_SWEEP_EVERY_WRITES = 50
+_writes_since_sweep = 0
+
+
+# Lookup outcomes since startup, so the cache's hit rate can be logged
+_stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """
+    Report how cache lookups have resolved since the process started.
+    Returns:
+        Counts of memory hits, disk hits and misses (expired entries count as misses).
+    """
+    return dict(_stats)
+
+
+def _remember(key: str, created: float, response: str) -> None:
+    _memory_cache[key] = (created, response)
+    _memory_cache.move_to_end(key)
+    if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def make_cache_key(*parts: str) -> str:
+    """
+    Build a stable cache key from the parts that determine a response.
+    Args:
+        parts: Prompt text, model name, max tokens, etc.
+    Returns:
+        Hex digest identifying the response.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        digest.update(str(part).encode())
+        # Separator so ("ab", "c") and ("a", "bc") produce different keys
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _read_cached_response(cache_dir: str, key: str) -> Optional[Tuple[float, str]]:
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        with open(path, 'rb') as f:
+            entry = orjson.loads(f.read())
+        # Entries written before timestamps were stored count as expired under any TTL
+        return entry.get("created", 0.0), entry["response"]
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_cached_response(cache_dir: str, key: str, created: float, response: str) -> None:
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{key}.json")
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps({"response": response, "created": created}))
+        # Atomic on POSIX and Windows, so readers never see a partial file
+        os.replace(tmp_path, path)
+    except OSError:
+        _remove_file(tmp_path)
+        raise
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _sweep_cache_dir(cache_dir: str, ttl: Optional[float], max_entries: int) -> int:
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(e.stat().st_mtime, e.path) for e in it if e.is_file() and e.name.endswith(".json")]
+    except FileNotFoundError:
+        return 0
+    
+    # Files are written once, so the modification time is the entry's creation time
+    entries.sort()
+    expired = 0
+    if ttl is not None:
+        cutoff = time.time() - ttl
+        expired = next((i for i, (mtime, _) in enumerate(entries) if mtime >= cutoff), len(entries))
+    excess = max(0, len(entries) - expired - max_entries)
+    for _, path in entries[:expired + excess]:
+        _remove_file(path)
+    return expired + excess
+
+
+async def sweep_cached_responses(cache_dir: str, ttl: Optional[float] = None,
+                                 max_entries: int = _MAX_DISK_ENTRIES) -> int:
+    """
+    Delete expired cache files and, past max_entries, the oldest remaining ones.
+    Args:
+        cache_dir: Directory holding the cache files.
+        ttl: Maximum age in seconds of a kept entry, or None for no expiry.
+        max_entries: Number of files to keep at most.
+    Returns:
+        The number of files removed.
+    """
+    try:
+        removed = await asyncio.to_thread(_sweep_cache_dir, cache_dir, ttl, max_entries)
+    except OSError as e:
+        logger.warning(f"⚠️ Failed to sweep the OpenAI response cache: {e}")
+        return 0
+    if removed:
+        logger.info(f"🧹 Removed {removed} old cached OpenAI responses")
+    return removed
+
+
+async def get_cached_response(cache_dir: str, key: str, ttl: Optional[float] = None) -> Optional[str]:
+    """
+    Look up a cached OpenAI response without blocking the event loop.
+    Recently used responses are served from memory; disk hits are promoted into memory.
+    Args:
+        cache_dir: Directory holding the cache files.
+        key: Key from make_cache_key.
+        ttl: Maximum age in seconds of a usable entry, or None for no expiry.
+    Returns:
+        The cached response text, or None on a miss or an expired entry.
+    """
+    entry = _memory_cache.get(key)
+    if entry is not None:
+        _memory_cache.move_to_end(key)
+        tier = "memory_hits"
+    else:
+        entry = await asyncio.to_thread(_read_cached_response, cache_dir, key)
+        if entry is None:
+            _stats["misses"] += 1
+            return None
+        _remember(key, *entry)
+        tier = "disk_hits"
+    
+    created, response = entry
+    if ttl is not None and time.time() - created > ttl:
+        _stats["misses"] += 1
+        # Drop the stale entry rather than keeping patient text around that will never be served
+        _memory_cache.pop(key, None)
+        try:
+            await asyncio.to_thread(_remove_file, os.path.join(cache_dir, f"{key}.json"))
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to remove expired OpenAI response: {e}")
+        return None
+    _stats[tier] += 1
+    return response
+
+
+async def set_cached_response(cache_dir: str, key: str, response: str, ttl: Optional[float] = None) -> None:
+    """
+    Store an OpenAI response in the cache without blocking the event loop.
+    Write failures are logged rather than raised, since the response itself is still valid.
+    Every few writes the directory is swept, so the cache stays bounded between restarts.
+    Args:
+        cache_dir: Directory holding the cache files.
+        key: Key from make_cache_key.
+        response: Response text to store.
+        ttl: Entry lifetime in seconds used by the periodic sweep, or None for no expiry.
+    """
+    global _writes_since_sweep
+    created = time.time()
+    _remember(key, created, response)
+    try:
+        await asyncio.to_thread(_write_cached_response, cache_dir, key, created, response)
+    except OSError as e:
+        logger.warning(f"⚠️ Failed to cache OpenAI response: {e}")
+        return
+    
+    _writes_since_sweep += 1
+    if _writes_since_sweep >= _SWEEP_EVERY_WRITES:
+        _writes_since_sweep = 0
+        await sweep_cached_responses(cache_dir, ttl)
@@ -0,0 +1,68 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucketLimiter:
+    """
+    Paces OpenAI requests under the account's requests-per-minute and tokens-per-minute limits.
+    Both buckets refill continuously, so requests go out at the sustainable rate instead of
+    bursting into 429s and backing off.
+    """
+
+    def __init__(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None):
+        """
+        Args:
+            requests_per_minute: Request limit, or None to leave requests unthrottled.
+            tokens_per_minute: Token limit, or None to leave tokens unthrottled.
+        """
+        self._request_rate = requests_per_minute / 60 if requests_per_minute else None
+        self._token_rate = tokens_per_minute / 60 if tokens_per_minute else None
+        # Buckets start full, allowing up to one minute's worth of burst
+        self._request_capacity = float(requests_per_minute or 0)
+        self._token_capacity = float(tokens_per_minute or 0)
+        self._max_requests = self._request_capacity
+        self._max_tokens = self._token_capacity
+        self._updated = time.monotonic()
+        # Waiters are served in arrival order, so a large request is not starved by small ones
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._request_rate is not None or self._token_rate is not None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self._request_rate:
+            self._request_capacity = min(self._max_requests, self._request_capacity + elapsed * self._request_rate)
+        if self._token_rate:
+            self._token_capacity = min(self._max_tokens, self._token_capacity + elapsed * self._token_rate)
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """
+        Wait until one request and the estimated tokens fit within both limits, then take them.
+        Args:
+            estimated_tokens: Prompt plus completion budget for the request.
+        """
+        if not self.enabled:
+            return
+        # A request larger than the whole bucket could never fit - cap it at one full bucket
+        if self._token_rate:
+            estimated_tokens = min(estimated_tokens, self._max_tokens)
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = 0.0
+                if self._request_rate and self._request_capacity < 1:
+                    wait = (1 - self._request_capacity) / self._request_rate
+                if self._token_rate and self._token_capacity < estimated_tokens:
+                    wait = max(wait, (estimated_tokens - self._token_capacity) / self._token_rate)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self._request_rate:
+                self._request_capacity -= 1
+            if self._token_rate:
+                self._token_capacity -= estimated_tokens
@@ -1,11 +1,72 @@
+import asyncio
+
 from reportlab.platypus import Paragraph, Spacer, ListFlowable, ListItem
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import cm ,inch
 
 
+# Styles are built once per process instead of on every call
+_styles = getSampleStyleSheet()
+_body_style = _styles['BodyText']
+
+# Custom header style
+_header_style = ParagraphStyle(
+    name='SectionHeader',
+    parent=_styles['Heading2'],
+    fontSize=12,
+    leading=18,
+    spaceAfter=6,
+    spaceBefore=12,
+    underlineWidth=1,
+)
+
+# Spacer heights only - ReportLab keeps layout state on every flowable, so Spacers are built per call
+_HEADER_SPACE = 0.1 * inch
+_BODY_SPACE = 0.15 * inch
+
+
 async def format_data_for_pdf(data: dict) -> list:
     """
     Converts structured JSON data into a list of ReportLab flowables.
+    Flowable construction is CPU-bound, so it runs in the default executor
+    to keep the event loop free while other sections are being generated.
+    
+    Args:
+        data (dict): Parsed JSON with keys and content types ('header', 'paragraph', 'bullet_points').
+
+    Returns:
+        list: A list of flowables (Paragraphs, Spacers, ListFlowable) ready for PDF generation.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, format_data_for_pdf_sync, data)
+
+
+def _header_flowables(content) -> list:
+    return [Paragraph(content, _header_style), Spacer(1, _HEADER_SPACE)]
+
+
+def _paragraph_flowables(content) -> list:
+    return [Paragraph(content, _body_style), Spacer(1, _BODY_SPACE)]
+
+
+def _bullet_point_flowables(content) -> list:
+    if not content:
+        return []
+    bullet_items = [ListItem(Paragraph(point, _body_style)) for point in content]
+    return [ListFlowable(bullet_items, bulletType='bullet'), Spacer(1, _BODY_SPACE)]
+
+
+# Flowable builder per content type; unknown types are skipped
+_CONTENT_BUILDERS = {
+    "header": _header_flowables,
+    "paragraph": _paragraph_flowables,
+    "bullet_points": _bullet_point_flowables,
+}
+
+
+def format_data_for_pdf_sync(data: dict) -> list:
+    """
+    Synchronous core of format_data_for_pdf.
     
     Args:
         data (dict): Parsed JSON with keys and content types ('header', 'paragraph', 'bullet_points').
@@ -13,36 +74,11 @@ async def format_data_for_pdf(data: dict) -> list:
     Returns:
         list: A list of flowables (Paragraphs, Spacers, ListFlowable) ready for PDF generation.
     """
-    styles = getSampleStyleSheet()
     elements = []
 
-    # Custom header style
-    header_style = ParagraphStyle(
-        name='SectionHeader',
-        parent=styles['Heading2'],
-        fontSize=12,
-        leading=18,
-        spaceAfter=6,
-        spaceBefore=12,
-        underlineWidth=1,
-    )
-
-    for key, value in data.items():
-        content_type = value.get("type")
-        content = value.get("content", "")
-
-        if content_type == "header":
-            elements.append(Paragraph(content, header_style))
-            elements.append(Spacer(1, 0.1 * inch))
-
-        elif content_type == "paragraph":
-            elements.append(Paragraph(content, styles['BodyText']))
-            elements.append(Spacer(1, 0.15 * inch))
-
-        elif content_type == "bullet_points":
-            if content:
-                bullet_items = [ListItem(Paragraph(point, styles['BodyText'])) for point in content]
-                elements.append(ListFlowable(bullet_items, bulletType='bullet'))
-                elements.append(Spacer(1, 0.15 * inch))
-
-    return elements
\ No newline at end of file
+    for value in data.values():
+        builder = _CONTENT_BUILDERS.get(value.get("type"))
+        if builder is not None:
+            elements.extend(builder(value.get("content", "")))
+
+    return elements
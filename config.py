@@ -6,7 +6,7 @@ Loads and validates environment variables from .env file
 import os
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -43,7 +43,13 @@ class Config:
         """Load OpenAI configuration"""
         config = {
             'api_key': os.getenv('OPENAI_API_KEY'),
-            'model': os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo'),
+            'model': os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+            'prompt_cache': os.getenv('OPENAI_PROMPT_CACHE', 'false').lower() == 'true',
+            'prompt_cache_ttl': int(os.getenv('OPENAI_PROMPT_CACHE_TTL', '604800')),
+            'service_tier': os.getenv('OPENAI_SERVICE_TIER') or None,
+            'max_inflight': int(os.getenv('OPENAI_MAX_INFLIGHT', '4')),
+            'max_rpm': int(os.getenv('OPENAI_MAX_RPM', '0')),
+            'max_tpm': int(os.getenv('OPENAI_MAX_TPM', '0')),
             'enabled': bool(os.getenv('OPENAI_API_KEY'))
         }
         
@@ -161,6 +167,11 @@ class Config:
         """Return the AI response directory"""
         return os.path.join(BASE_DIR, 'assets', 'responses')
     
+
+    def get_prompt_cache_dir(self) -> str:
+        """Return the directory for cached OpenAI responses"""
+        return os.path.join(BASE_DIR, 'assets', 'cache')
+    
     
     def get_feature_status(self) -> Dict[str, bool]:
         """Get status of all features"""
@@ -198,10 +209,31 @@ def get_openai_model() -> str:
     """Get OpenAI model"""
     return config.openai['model']
 
+def get_openai_service_tier() -> Optional[str]:
+    """Get OpenAI service tier (e.g. 'flex' for cheaper, slower batch runs)"""
+    return config.openai['service_tier']
+
+def get_openai_max_inflight() -> int:
+    """Get the cap on concurrent OpenAI requests, shared by every report in the process"""
+    return max(1, config.openai['max_inflight'])
+
+def get_openai_rate_limits() -> Tuple[Optional[int], Optional[int]]:
+    """Get the requests and tokens per minute to pace OpenAI calls to (None where unlimited)"""
+    return config.openai['max_rpm'] or None, config.openai['max_tpm'] or None
+
 def is_openai_enabled() -> bool:
     """Check if OpenAI is enabled"""
     return config.openai['enabled']
 
+def is_prompt_cache_enabled() -> bool:
+    """Check if OpenAI responses are cached on disk"""
+    return config.openai['prompt_cache']
+
+def get_prompt_cache_ttl() -> Optional[int]:
+    """Get the cached response lifetime in seconds (None when entries never expire)"""
+    ttl = config.openai['prompt_cache_ttl']
+    return ttl if ttl > 0 else None
+
 def is_email_enabled() -> bool:
     """Check if email is enabled"""
     return config.email['enabled']
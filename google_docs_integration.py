@@ -1,5 +1,6 @@
+import asyncio
 import os
-import json
+import orjson
 from typing import Dict, Any, List
 from datetime import datetime
 import logging
@@ -239,8 +240,8 @@ class GoogleDocsReportGenerator:
             
             # Try to parse JSON
             try:
-                credentials_data = json.loads(content)
-            except json.JSONDecodeError as e:
+                credentials_data = orjson.loads(content)
+            except orjson.JSONDecodeError as e:
                 return {
                     'valid': False,
                     'error': f'Invalid JSON format: {e}'
@@ -548,12 +549,16 @@ class GoogleDocsReportGenerator:
         # Extract assessment context
         extracted_data = report_data.get("extracted_data", {})
         assessments = report_data.get("assessments", {})
+        # Compact JSON rather than the dict's repr - no whitespace tokens between keys and values
+        assessment_context = orjson.dumps(
+            assessments, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+        ).decode()
         
         consolidated_prompt = f"""
         Generate ALL sections for a pediatric OT evaluation report for {child_name} (age: {age}). 
         
         Patient Info: {child_name}, age {age}, caregiver: {parent_name}
-        Assessment Data: {assessments}
+        Assessment Data: {assessment_context}
         
         Generate these EXACT sections with clear section markers:
         
@@ -670,7 +675,9 @@ class GoogleDocsReportGenerator:
         
         try:
             self.logger.info(f"📡 Sending request to OpenAI API with model: {model}...")
-            response = self.openai_client.chat.completions.create(
+            # The client is synchronous - run it in a worker thread so the event loop stays free
+            response = await asyncio.to_thread(
+                self.openai_client.chat.completions.create,
                 model=model,
                 messages=[
                     {
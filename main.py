@@ -4,11 +4,11 @@ import logging
 import os
 import shutil
 from typing import Dict, Any, Optional
-from traceback import format_exc
 import uuid
 
 # Load configuration first
 from config import config, is_openai_enabled, is_email_enabled, is_google_docs_enabled, get_app_host, get_app_port
+from config import is_prompt_cache_enabled, get_prompt_cache_ttl
 
 # Create logs directory if needed
 if config.app['log_to_file']:
@@ -54,6 +54,8 @@ else:
     logger.warning("⚠️ Email not configured - email notifications disabled")
 
 from report_generator import OTReportGenerator
+from backend.prompts import flush_pending_saves
+from backend.utils.cache import sweep_cached_responses
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -125,11 +127,29 @@ async def startup_event():
     os.makedirs("uploads", exist_ok=True)
     os.makedirs("outputs", exist_ok=True)
     
+    # Cached responses hold patient narratives - clear out expired ones left by previous runs
+    if is_prompt_cache_enabled():
+        await sweep_cached_responses(config.get_prompt_cache_dir(), get_prompt_cache_ttl())
+    
     # Display startup status
     display_startup_status()
     
     logger.info("🎉 Application startup complete!")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Finish pending background work before the process exits"""
+    logger.info("💾 Flushing pending AI response saves...")
+    await flush_pending_saves()
+    if openai_report_generator:
+        await openai_report_generator.aclose()
+    logger.info("👋 Application shutdown complete")
+
+def _write_upload(file_path: str, file_content: bytes) -> None:
+    """Write an uploaded file to disk (runs in a worker thread)"""
+    with open(file_path, "wb") as buffer:
+        buffer.write(file_content)
+
 def display_startup_status():
     """Display comprehensive startup status dashboard"""
     logger.info("=" * 60)
@@ -273,8 +293,8 @@ async def upload_files(
                 
                 file_path = os.path.join(session_dir, f"{file_type}.pdf")
                 try:
-                    with open(file_path, "wb") as buffer:
-                        buffer.write(file_content)
+                    # Uploads can be tens of MB - write in a worker thread to keep the event loop free
+                    await asyncio.to_thread(_write_upload, file_path, file_content)
                     uploaded_files[file_type] = file_path
                     logger.info(f"✅ Saved {file_type}: {file_obj.filename} ({file_size_mb:.2f} MB)")
                 except Exception as e:
@@ -311,7 +331,8 @@ async def upload_files(
             # Log what was extracted
             for assessment_type, data in extracted_data.items():
                 if data:
-                    logger.info(f"📋 Extracted data from {assessment_type}: {len(str(data))} characters")
+                    # Field count rather than len(str(data)), which rendered the whole extraction just to measure it
+                    logger.info(f"📋 Extracted data from {assessment_type}: {len(data)} fields")
                 else:
                     logger.warning(f"⚠️ No data extracted from {assessment_type}")
                     
@@ -432,8 +453,7 @@ async def upload_files(
         })
         
     except Exception as e:
-        print(format_exc())
-        logger.error(f"❌ Report generation failed: {e}")
+        logger.exception(f"❌ Report generation failed: {e}")
         return templates.TemplateResponse("result.html", {
             "request": request,
             "success": False,
@@ -1,23 +1,47 @@
+import asyncio
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dateutil import parser
+import functools
+import inspect
 import io
-import json
 import logging
 import os
+import random
 import re
-from traceback import format_exc
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # Import configuration
 from config import config
-from config import get_openai_api_key, get_openai_model, is_openai_enabled
+from config import (
+    get_openai_api_key, get_openai_max_inflight, get_openai_model, get_openai_rate_limits, get_openai_service_tier,
+    get_prompt_cache_ttl, is_openai_enabled, is_prompt_cache_enabled,
+)
 
 try:
+    import httpx
     import openai
+    # Transient failures worth another attempt; auth and bad-request errors are not
+    _RETRYABLE_OPENAI_ERRORS = (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)
+    # The API key itself was rejected (invalid or revoked), as opposed to a per-model or per-region refusal
+    _CREDENTIAL_OPENAI_ERRORS = (openai.AuthenticationError,)
+    # Raised (among others) when the model does not support the requested response_format
+    _BAD_REQUEST_OPENAI_ERRORS = (openai.BadRequestError,)
     OPENAI_AVAILABLE = True
 except ImportError:
+    _RETRYABLE_OPENAI_ERRORS = ()
+    _CREDENTIAL_OPENAI_ERRORS = ()
+    _BAD_REQUEST_OPENAI_ERRORS = ()
     OPENAI_AVAILABLE = False
 
+try:
+    # Optional - lets httpx multiplex the concurrent section requests over one HTTP/2 connection
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Configure logging for this module (after imports)
 logger = logging.getLogger(__name__)
 
@@ -26,10 +50,11 @@ if OPENAI_AVAILABLE:
 else:
     logger.warning("⚠️ OpenAI library not available - install with: pip install openai")
 
-from PIL import Image as PILImage
+import orjson
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 from reportlab.platypus import (
     Image,
     Paragraph, 
@@ -43,13 +68,539 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from reportlab.lib import colors
 
 
-from backend.prompts import save_response, remove_lang_tags, get_prompt
+from backend.prompts import save_response_in_background, remove_lang_tags, get_prompt
 from backend.utils.response import format_data_for_pdf
+from backend.utils.cache import make_cache_key, get_cache_stats, get_cached_response, set_cached_response
+from backend.utils.rate_limit import TokenBucketLimiter
+
+
+# Report palette - HexColor parses its string on every call, so shared colors are parsed once
+_COLOR_PRIMARY = colors.HexColor('#1f4788')
+_COLOR_LABEL_TEXT = colors.HexColor('#2d3748')
+_COLOR_VALUE_TEXT = colors.HexColor('#1a202c')
+_COLOR_MUTED_TEXT = colors.HexColor('#4a5568')
+_COLOR_LABEL_BG = colors.HexColor('#f8f9fa')
+_COLOR_ALT_ROW_BG = colors.HexColor('#f7fafc')
+_COLOR_GRID = colors.HexColor('#cbd5e0')
+
+
+# [SECTION] header line in the marker-based consolidated response format
+_SECTION_HEADER_RE = re.compile(r'\[(.*)\]')
+
+# "Patient: Name (age)" style fields embedded in prompts, read by the fallback text generator
+_FALLBACK_FIELD_RE = re.compile(r'(Patient|Child|Parent/Guardian):[ \t]*([^\n(]*)(?:\(([^)\n]*)\))?')
+
+# System message for every report generation request
+# (the style guidance lives in each prompt, so this stays a single sentence)
+_SYSTEM_PROMPT = (
+    "You are a pediatric occupational therapist writing objective, evidence-based clinical evaluation reports."
+)
+
+# Fallback text templates used when OpenAI is unavailable, keyed by report section
+_FALLBACK_TEMPLATES = {
+    "background": "A developmental evaluation was recommended by the Regional Center to determine {patient_name}'s current level of performance and to guide service frequency recommendations for early intervention.",
+    "caregiver_concerns": "{parent_name} expressed broad concerns regarding {patient_name}'s overall development. She noted challenges with attention span and focus during structured activities, indicating difficulty with sustained engagement. {parent_name} also reported concerns about fine motor skill development and {patient_name}'s ability to manipulate small objects. Of particular concern is {patient_name}'s communication development and behavioral regulation during transitions between activities.",
+    "observations": "{patient_name} participated in an in-clinic evaluation with the caregiver present. {patient_name} presented with a cooperative affect initially but demonstrated variable attention span throughout the assessment. Muscle tone appeared typical for chronological age, with adequate range of motion observed. However, participation was impacted by distractibility and need for frequent redirection. During structured tasks, {patient_name} required verbal and visual cues to maintain engagement. Fine motor coordination showed areas for development, with tasks requiring hand-over-hand assistance for completion. These factors impacted standardized testing and required modifications to maintain participation.",
+    "domain": "{patient_name} demonstrated variable performance in {domain_name} during assessment. {score_info}Clinical observations revealed both emerging skills and areas requiring support. During testing activities, {patient_name} showed intermittent engagement with tasks requiring sustained attention and effort. Performance patterns suggest the need for structured intervention to support skill development in this domain. These findings indicate that {patient_name} would benefit from targeted therapeutic intervention.",
+    "summary": "{patient_name} (chronological age: {age}) was assessed using multiple standardized pediatric assessment tools to evaluate developmental functioning across cognitive, motor, sensory processing, and adaptive behavior domains. The comprehensive evaluation revealed both areas of emerging strength and areas requiring targeted intervention support. Based on the assessment findings, occupational therapy services are recommended to address identified areas of need and support optimal developmental progression. A collaborative, family-centered approach involving occupational therapy and related services will be beneficial to address the client's comprehensive developmental needs. Regular monitoring and reassessment will be important to track progress and adjust intervention strategies as needed.",
+    "goals": "\n".join(f"{i + 1}. {goal}" for i, goal in enumerate((
+        "Within six months, {patient_name} will stack 4-5 one-inch blocks independently in 4 out of 5 opportunities with minimal verbal prompts, to improve visual-motor coordination and hand stability for age-appropriate play skills.",
+        "Within six months, {patient_name} will string 2-3 large beads onto a shoelace in 4 out of 5 opportunities with moderate assistance, demonstrating bilateral hand coordination and crossing midline.",
+        "Within six months, {patient_name} will use a pincer grasp to pick up and place small objects (cheerios, blocks) in 4 out of 5 opportunities with minimal cues, improving fine motor precision for functional tasks.",
+        "Within six months, {patient_name} will spontaneously scribble on paper using an age-appropriate grasp in 4 out of 5 opportunities with minimal prompts, promoting pre-writing skill development and creative expression.",
+    ))),
+}
+_GENERIC_FALLBACK_TEXT = "Based on comprehensive standardized assessment findings, the client demonstrates a mixed profile of developmental strengths and areas requiring targeted intervention support. Clinical observations and assessment results indicate the need for structured therapeutic intervention to promote optimal developmental outcomes."
+
+# Prompt keywords that select a fallback section; when several appear the earliest section in
+# _FALLBACK_SECTION_PRIORITY wins, matching the order the sections were originally checked in
+_FALLBACK_KEYWORD_SECTIONS = {
+    "background": "background",
+    "caregiver concerns": "caregiver_concerns",
+    "observation": "observations",
+    "cognitive": "domain",
+    "receptive": "domain",
+    "expressive": "domain",
+    "fine motor": "domain",
+    "gross motor": "domain",
+    "social-emotional": "domain",
+    "summary": "summary",
+    "goals": "goals",
+}
+_FALLBACK_SECTION_PRIORITY = ("background", "caregiver_concerns", "observations", "domain", "summary", "goals")
+_FALLBACK_KEYWORD_RE = re.compile("|".join(map(re.escape, _FALLBACK_KEYWORD_SECTIONS)))
+
+# Name field read from the prompt for each section, with the default used when it is missing
+_FALLBACK_NAME_FIELDS = {
+    "background": ("Patient", "the client"),
+    "caregiver_concerns": ("Child", "the child"),
+    "observations": ("Patient", "The child"),
+    "domain": ("Patient", "The child"),
+    "summary": ("Patient", "The child"),
+    "goals": ("Patient", "the child"),
+}
+_FALLBACK_DOMAINS = ("Cognitive", "Receptive Communication", "Expressive Communication", "Fine Motor", "Gross Motor", "Social-Emotional")
+
+
+def _sections_response_format(name: str, sections: Tuple[str, ...],
+                               list_sections: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """Structured-outputs response format for a JSON object holding one string per section
+    (or an array of strings for the list_sections)"""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    section: {"type": "array", "items": {"type": "string"}} if section in list_sections
+                    else {"type": "string"}
+                    for section in sections
+                },
+                "required": list(sections),
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+# Keys the consolidated narratives request returns, each with fallback text in _get_consolidated_fallbacks
+_CONSOLIDATED_SECTIONS = ("background", "caregiver_concerns", "observations", "summary", "recommendations", "goals")
+
+# Strict schema, so every section key is always present and no reply needs the marker-text fallback
+# Recommendations and goals come back as arrays, so they never need to be split out of free text
+_CONSOLIDATED_RESPONSE_FORMAT = _sections_response_format(
+    "report_sections", _CONSOLIDATED_SECTIONS, list_sections=("recommendations", "goals")
+)
+
+# Bullet or number a list item may still carry when it comes from text (fallbacks, marker replies)
+_LIST_MARKER_RE = re.compile(r'^(?:[•*-]|\d+[.)])\s*')
+
+# Sections of the Google Docs narratives request, which is packed into one JSON reply the same way
+_DOCS_NARRATIVE_SECTIONS = ("background", "clinical_observations", "professional_summary")
+_DOCS_NARRATIVE_RESPONSE_FORMAT = _sections_response_format("docs_narratives", _DOCS_NARRATIVE_SECTIONS)
+
+# Used instead of a json_schema format on models without Structured Outputs (e.g. gpt-4, gpt-3.5-turbo);
+# keys are then not guaranteed, which the missing-section fallbacks already cover
+_JSON_OBJECT_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Namespace for OpenAI's prompt_cache_key - requests sharing a key are routed together so their
+# common prompt prefix is served from the provider cache; bump the version when the prompts change
+_PROMPT_CACHE_NAMESPACE = "ot-report-v1"
+
+# Completion budgets sized to each section's requested length (2-3 sentences, 6-8 sentences, 4 goals...);
+# latency scales with generated tokens, so these stay close to what a full answer actually needs
+_SECTION_MAX_TOKENS = {
+    "background": 150,
+    "caregiver_concerns": 250,
+    "observations": 400,
+    "summary": 400,
+    "recommendations": 250,
+    "goals": 350,
+}
+
+# Instructions for the consolidated narratives request; kept free of patient details so every
+# report sends a byte-identical prefix, with the patient context appended after it
+_CONSOLIDATED_INSTRUCTIONS = """Generate ALL sections for a pediatric OT evaluation report for the child described in the PATIENT CONTEXT below.
+
+Return a single JSON object with these EXACT keys:
+
+"background": 2-3 sentences: "A developmental evaluation was recommended by the Regional Center to determine [child's name]'s current level of performance..."
+
+"caregiver_concerns": 3-4 sentences about the caregiver's concerns regarding the child's development, attention, fine motor skills, transitions, etc.
+
+"observations": 6-8 sentences about the child's participation in evaluation, muscle tone, attention span, task engagement, assistance needed.
+
+"summary": comprehensive 6-8 sentence summary covering assessment findings, strengths, needs, intervention recommendations.
+
+"recommendations": array of 4-6 therapy recommendations (PT, ST, OT frequency, early intervention), one per string.
+
+"goals": array of 4 specific SMART OT goals with timelines, measurable criteria, assistance levels, one per string, without numbering.
+
+Refer to the child and caregiver by the names given in the PATIENT CONTEXT.
+Use professional clinical language. Keep each section focused and concise.
+"""
+
+# Static instructions for the per-assessment narratives; the assessment data is appended after
+# them so every report shares the same prompt prefix, like _CONSOLIDATED_INSTRUCTIONS
+_BAYLEY_INSTRUCTIONS = """Write a comprehensive Bayley-4 assessment interpretation for a pediatric OT report.
+
+Requirements:
+- Include specific scaled scores, age equivalents, and percentile rankings
+- Calculate and report percentage delays where applicable
+- Compare performance to chronological age expectations
+- Include range classifications (extremely low, below average, average, above average)
+- Link findings to observed functional limitations
+- Describe specific tasks and child's performance
+- Use professional clinical language
+- Provide detailed interpretation for each domain tested
+- Include implications for intervention planning
+
+Write as detailed clinical narrative covering all tested domains with specific scores and interpretations.
+"""
+
+_SP2_INSTRUCTIONS = """Write a detailed Sensory Profile 2 (SP2) interpretation for a pediatric OT report.
+
+Requirements:
+- Explain Seeking, Avoiding, Sensitivity, and Registration scores
+- Include specific score interpretations and quadrant analysis
+- Provide real-world implications for grooming, play, and feeding
+- Describe sensory processing patterns and their impact
+- Include recommendations for sensory strategies
+- Use professional sensory integration terminology
+- Connect findings to functional performance in daily activities
+
+Focus on how sensory processing affects daily living skills and participation.
+"""
+
+# Confidentiality notice at the foot of every report
+_DISCLAIMER_TEXT = (
+    "<i>This report contains confidential medical information and is intended solely for the use of "
+    "the identified patient and authorized personnel. Distribution or reproduction without written "
+    "consent is prohibited.</i>"
+)
+
+# PDF builds hold the GIL for most of their run, so a few threads are enough to overlap one
+# report's rendering with another's I/O; more would only contend. Concurrent builds share only
+# read-only state (styles, TableStyles, the decoded header image) - every flowable in a story,
+# Spacers included, is created for that report, since drawing assigns canv on the flowable
+_PDF_BUILD_EXECUTOR = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="pdf-build")
+
+
+# Table styles are static, so each TableStyle is built and normalized once per process
+_SCORE_TABLE_STYLE = TableStyle([
+    # Header row styling
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_PRIMARY),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+
+    # Data rows styling
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('TEXTCOLOR', (0, 1), (-1, -1), _COLOR_LABEL_TEXT),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('ALIGN', (1, 1), (-1, -1), 'CENTER'),  # Center all except domain names
+    ('ALIGN', (0, 1), (0, -1), 'LEFT'),     # Left align domain names
+
+    # Borders and grid
+    ('GRID', (0, 0), (-1, -1), 0.75, _COLOR_GRID),
+    ('LINEBELOW', (0, 0), (-1, 0), 2, _COLOR_PRIMARY),
+
+    # Padding
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+
+    # Alternating row colors for better readability
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _COLOR_ALT_ROW_BG]),
+
+    # Highlight low scores in red
+    ('TEXTCOLOR', (2, 1), (2, -1), colors.HexColor('#e53e3e')),  # Scaled scores
+])
+
+_PATIENT_COL_WIDTHS = (1.6*inch, 2.2*inch, 1.6*inch, 2.2*inch)
+
+_PATIENT_TABLE_STYLE = TableStyle([
+    # Background colors for better visual hierarchy
+    ('BACKGROUND', (0, 0), (0, -1), _COLOR_LABEL_BG),  # Label columns
+    ('BACKGROUND', (2, 0), (2, -1), _COLOR_LABEL_BG),  # Label columns
+    ('BACKGROUND', (1, 0), (1, -1), colors.white),  # Data columns
+    ('BACKGROUND', (3, 0), (3, -1), colors.white),  # Data columns
+
+    # Text alignment and fonts
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+
+    # Font styling
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),  # Label columns bold
+    ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),  # Label columns bold
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),       # Data columns normal
+    ('FONTNAME', (3, 0), (3, -1), 'Helvetica'),       # Data columns normal
+
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('TEXTCOLOR', (0, 0), (0, -1), _COLOR_LABEL_TEXT),  # Label color
+    ('TEXTCOLOR', (2, 0), (2, -1), _COLOR_LABEL_TEXT),  # Label color
+    ('TEXTCOLOR', (1, 0), (1, -1), _COLOR_VALUE_TEXT),  # Data color
+    ('TEXTCOLOR', (3, 0), (3, -1), _COLOR_VALUE_TEXT),  # Data color
+
+    # Padding for better spacing
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+
+    # Borders for professional appearance
+    ('GRID', (0, 0), (-1, -1), 0.75, _COLOR_GRID),
+    ('LINEBELOW', (0, 0), (-1, 0), 1.5, _COLOR_MUTED_TEXT),  # Header underline
+
+    # Row-specific styling
+    ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, _COLOR_ALT_ROW_BG]),
+])
+
+# The contact block is identical in every report
+_CONTACT_DATA = (
+    ("Organization:", "FMRC Health Group"),
+    ("Address:", "1626 Centinela Ave, Suite 108"),
+    ("", "Inglewood, CA 90302"),
+    ("Phone:", "(555) 123-4567"),
+    ("Email:", "fcrooms@fmrchealth.com"),
+    ("Website:", "www.fmrchealth.com"),
+)
+_CONTACT_COL_WIDTHS = (1.2*inch, 4*inch)
+
+_CONTACT_TABLE_STYLE = TableStyle([
+    # Background and borders
+    ('BACKGROUND', (0, 0), (-1, -1), _COLOR_LABEL_BG),
+    ('GRID', (0, 0), (-1, -1), 0.5, _COLOR_GRID),
+
+    # Text styling
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('TEXTCOLOR', (0, 0), (0, -1), _COLOR_LABEL_TEXT),
+    ('TEXTCOLOR', (1, 0), (1, -1), _COLOR_VALUE_TEXT),
+
+    # Alignment
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+
+    # Padding
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+])
+
+# Signature block - static apart from the Table instance, which ReportLab mutates during layout
+_SIGNATURE_DATA = (
+    # Signature line
+    ("Signature: ___________________________________", "Date: _______________"),
+    ("", ""),
+    # Professional credentials
+    ("Fushia Crooms, MOT, OTR/L", ""),
+    ("Occupational Therapist", ""),
+    ("License #: OTR/L12345", ""),
+)
+_SIGNATURE_COL_WIDTHS = (4.5*inch, 2*inch)
+
+_SIGNATURE_TABLE_STYLE = TableStyle([
+    # General styling
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+
+    # Signature line styling
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, 0), 'Helvetica-Bold'),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _COLOR_LABEL_TEXT),
+
+    # Professional name and credentials
+    ('FONTNAME', (0, 2), (0, 2), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 2), (0, 2), 12),
+    ('TEXTCOLOR', (0, 2), (0, 2), _COLOR_PRIMARY),
+
+    # Title and license
+    ('TEXTCOLOR', (0, 3), (0, 4), _COLOR_MUTED_TEXT),
+    ('FONTSIZE', (0, 3), (0, 4), 10),
+
+    # Padding
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+])
+
+# Rule under the patient information block
+_SEPARATOR_DATA = (("", "", "", ""),)
+
+_SEPARATOR_TABLE_STYLE = TableStyle([
+    ('LINEABOVE', (0, 0), (-1, 0), 2, _COLOR_PRIMARY),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+])
+
+
+# Score interpretation tables - thresholds are ascending and each label tuple has one more entry
+# than its thresholds; bisect_right gives ">= threshold" bands, bisect_left gives "> threshold" bands
+_CLASSIFICATION_THRESHOLDS = (4, 8, 16)
+_CLASSIFICATION_LABELS = ("Extremely Low", "Below Average", "Average", "Above Average")
+
+_PERCENTILE_THRESHOLDS = (4, 8, 13, 16)
+_PERCENTILE_VALUES = (5, 25, 50, 75, 85)
+
+_CHOMPS_CONCERN_THRESHOLDS = (2, 4, 7)
+_CHOMPS_CONCERN_LEVELS = (
+    "No concern - typical feeding behaviors for age",
+    "Mild concern - minor feeding difficulties that may benefit from strategies",
+    "Moderate concern - feeding challenges that warrant monitoring and intervention",
+    "High concern - significant feeding difficulties requiring immediate intervention",
+)
+
+_SP2_THRESHOLDS = (40, 60)
+_SP2_SEEKING = (
+    "Low sensory seeking - limited interest in sensory exploration, may appear withdrawn from sensory experiences",
+    "Typical sensory seeking - appropriate interest in sensory experiences",
+    "High sensory seeking behaviors - actively seeks intense sensory input, may appear restless or constantly moving",
+)
+_SP2_AVOIDING = (
+    "Low sensory avoiding - tolerates most sensory experiences well",
+    "Typical sensory avoiding - appropriate behavioral responses to overwhelming sensory input",
+    "High sensory avoiding - actively avoids sensory input, may be overwhelmed by everyday sensations",
+)
+_SP2_SENSITIVITY = (
+    "Low sensory sensitivity - may miss subtle sensory cues in environment",
+    "Typical sensory sensitivity - notices sensory input at expected levels",
+    "High sensory sensitivity - notices sensory input others miss, easily distracted by background stimuli",
+)
+_SP2_REGISTRATION = (
+    "Good sensory registration - consistently notices and responds to sensory input",
+    "Typical sensory registration - notices relevant sensory information appropriately",
+    "High registration challenges - misses important sensory information, appears unaware of sensory input",
+)
+
+_PEDIEAT_THRESHOLDS = (7, 14)
+_PEDIEAT_PHYSIOLOGY = (
+    "Typical physiological function - no significant concerns with physical eating processes",
+    "Moderate physiological symptoms - some concerns with physical aspects of eating and growth",
+    "Elevated physiological symptoms - significant concerns with growth, medical complexity, or physical function during meals",
+)
+_PEDIEAT_PROCESSING = (
+    "Typical sensory processing - appropriate sensory responses during eating",
+    "Moderate processing symptoms - some sensory processing differences impacting food acceptance",
+    "Elevated processing symptoms - significant sensory processing challenges affecting eating and mealtime participation",
+)
+_PEDIEAT_BEHAVIOR = (
+    "Typical mealtime behaviors - appropriate social engagement and cooperation during meals",
+    "Moderate behavioral symptoms - some challenging mealtime behaviors requiring strategies",
+    "Elevated behavioral symptoms - significant challenging behaviors during mealtimes affecting family dynamics",
+)
+_PEDIEAT_SELECTIVITY = (
+    "Typical food selectivity - age-appropriate food preferences and acceptance",
+    "Moderate selectivity symptoms - some food preferences and limitations affecting meal planning",
+    "Elevated selectivity symptoms - severe food selectivity limiting nutritional intake and food variety",
+)
+
+
+# Functional implications by Bayley-4 domain and range classification
+_DOMAIN_IMPLICATIONS = {
+    "Cognitive": {
+        "Above Average": "demonstrates advanced problem-solving, memory, and learning abilities with strong visual processing skills",
+        "Average": "shows age-appropriate cognitive processing, problem-solving, and learning capacity",
+        "Below Average": "experiences mild challenges in problem-solving and cognitive processing that may impact learning",
+        "Extremely Low": "demonstrates significant cognitive delays requiring intensive intervention support"
+    },
+    "Receptive Communication": {
+        "Above Average": "exceptional language comprehension with advanced understanding of instructions and vocabulary",
+        "Average": "age-appropriate understanding of spoken language and ability to follow instructions",
+        "Below Average": "mild difficulties understanding spoken language and following complex instructions",
+        "Extremely Low": "significant language comprehension delays affecting daily communication and learning"
+    },
+    "Expressive Communication": {
+        "Above Average": "advanced verbal expression with rich vocabulary and complex sentence formation",
+        "Average": "age-appropriate verbal expression and communication skills",
+        "Below Average": "limited verbal expression that may impact social communication",
+        "Extremely Low": "severe expressive language delays requiring intensive speech therapy intervention"
+    },
+    "Fine Motor": {
+        "Above Average": "exceptional hand-eye coordination and manipulation skills beyond age expectations",
+        "Average": "age-appropriate fine motor control and manipulation abilities",
+        "Below Average": "mild fine motor delays that may impact self-care and pre-academic skills",
+        "Extremely Low": "significant fine motor delays affecting daily living skills and academic readiness"
+    },
+    "Gross Motor": {
+        "Above Average": "advanced gross motor coordination, balance, and movement skills",
+        "Average": "age-appropriate gross motor development and movement patterns",
+        "Below Average": "mild gross motor delays that may impact mobility and play participation",
+        "Extremely Low": "significant gross motor delays requiring intensive physical therapy intervention"
+    }
+}
+
+# ChOMPS domains scored in the analysis, in report order
+_CHOMPS_DOMAINS = ("oral_motor", "oral_sensory", "behavioral", "pharyngeal", "esophageal")
+
+
+# Scaled scores below this are treated as a below-average area of concern
+_LOW_SCALED_SCORE = 7
+
+
+def _compact_json(data: Any) -> str:
+    """Serialize assessment data for a prompt without whitespace - a dict's repr spends a token on every ', ' and ': '"""
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str).decode()
+
+
+def _score_stats(scaled_scores: Dict[str, int]) -> Tuple[float, List[str]]:
+    """Mean scaled score and below-average domains, computed in a single pass"""
+    total = 0
+    low_domains = []
+    for domain, score in scaled_scores.items():
+        total += score
+        if score < _LOW_SCALED_SCORE:
+            low_domains.append(domain)
+    return (total / len(scaled_scores) if scaled_scores else 0), low_domains
+
+
+def _score_profile(scaled_scores: Dict[str, int]) -> Tuple[float, List[str], List[str]]:
+    """Mean scaled score, strength domains (>= 10) and need domains (< 8, lowercased) in a single pass"""
+    total = 0
+    strengths = []
+    needs = []
+    for domain, score in scaled_scores.items():
+        total += score
+        if score >= 10:
+            strengths.append(domain.lower())
+        elif score < 8:
+            needs.append(domain.lower())
+    return (total / len(scaled_scores) if scaled_scores else 0), strengths, needs
+
+
+def _score_bucket(avg_score: float) -> int:
+    """0 for below average, 1 for mixed/typical, 2 for above average"""
+    return (avg_score >= _LOW_SCALED_SCORE) + (avg_score > 13)
+
+
+# Performance pattern wording indexed by _score_bucket
+_COGNITIVE_PATTERNS = (
+    "below average cognitive-motor performance",
+    "mixed cognitive-motor profile",
+    "above average cognitive-motor abilities",
+)
+_SOCIAL_PATTERNS = (
+    "challenges in social-emotional development",
+    "typical social-emotional functioning",
+    "strengths in social-emotional areas",
+)
+
+# Summary prompt wording indexed by _score_bucket
+_COGNITIVE_ANALYSIS = (
+    "significant delays in cognitive-motor domains",
+    "mixed cognitive-motor profile with areas of both strength and need",
+    "above-average cognitive-motor abilities",
+)
+_SOCIAL_ANALYSIS = (
+    "challenges in social-emotional and adaptive behavior development",
+    "typical social-emotional development with some areas for growth",
+    "strengths in social-emotional functioning",
+)
 
 
 class OpenAIEnhancedReportGenerator:
     """Professional OT Report Generator using OpenAI for clinical narratives"""
     
+    # Flex processing can queue requests for minutes, well past the client's default timeout
+    FLEX_REQUEST_TIMEOUT = 900.0
+    
+    # Per-attempt deadline grows with the token budget, so a stalled request is cut off and
+    # reissued instead of holding up the whole gather for the client's full timeout
+    OPENAI_ATTEMPT_TIMEOUT_BASE = 10.0
+    OPENAI_ATTEMPT_TIMEOUT_PER_TOKEN = 0.02
+    OPENAI_MAX_ATTEMPTS = 3
+    OPENAI_RETRY_BASE_DELAY = 0.5
+    
     def __init__(self):
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.logger.info("🧠 Initializing OpenAI Enhanced Report Generator...")
@@ -59,8 +610,26 @@ class OpenAIEnhancedReportGenerator:
         self._setup_custom_styles()
         self.logger.info("✅ ReportLab styles configured")
         
-        # Initialize OpenAI based on configuration
+        # Header image never changes within a run - resolve and decode it once
+        self._header_image_path = self.config.get_header_image_path()
+        self._header_image_reader = self._load_header_image_reader()
+        
+        # Prompt builders specialized per assessment type once, instead of re-dispatching on every report
+        self._prompt_chomps = functools.partial(get_prompt, prompt_type="chomps", json_format=True)
+        self._prompt_pedieat = functools.partial(get_prompt, prompt_type="pedieat", json_format=True)
+        
+        # Initialize OpenAI based on configuration - the model is fixed for the process lifetime
+        self._model = get_openai_model()
+        self._service_tier = get_openai_service_tier()
+        # Cleared the first time the model rejects a json_schema response format
+        self._structured_outputs = True
         self.openai_client = None
+        self._http_client = None
+        # One generator serves every upload, so this bounds requests in flight across all concurrent
+        # reports - sized to the account's rate limits rather than per report
+        self._max_inflight = get_openai_max_inflight()
+        self._openai_semaphore = asyncio.Semaphore(self._max_inflight)
+        self._rate_limiter = TokenBucketLimiter(*get_openai_rate_limits())
         self._initialize_openai()
     
     def _initialize_openai(self):
@@ -77,49 +646,47 @@ class OpenAIEnhancedReportGenerator:
             return
         
         api_key = get_openai_api_key()
-        model = get_openai_model()
+        model = self._model
         
         try:
             # Initialize OpenAI client with configuration
             self.logger.info(f"🔧 Creating OpenAI client with model: {model}")
             
-            # Try different initialization methods for compatibility
-            try:
-                # Modern OpenAI library (v1.0+)
-                self.openai_client = openai.OpenAI(
-                    api_key=api_key,
-                    timeout=30.0
-                )
-                self.logger.info("✅ OpenAI client initialized with modern API")
-            except TypeError as e:
-                self.logger.warning(f"⚠️ Modern OpenAI init failed: {e}")
-                # Fallback for older versions
-                try:
-                    self.openai_client = openai.OpenAI(api_key=api_key)
-                    self.logger.info("✅ OpenAI client initialized with basic config")
-                except Exception as fallback_error:
-                    self.logger.error(f"❌ Both initialization methods failed: {fallback_error}")
-                    self.openai_client = None
-                    return
-            
-            # Test API connection with configured model
-            try:
-                self.logger.info("🧪 Testing OpenAI API connection...")
-                test_response = self.openai_client.chat.completions.create(
-                    model=model,
-                    messages=[{"role": "user", "content": "Hello"}],
-                    max_tokens=5
-                )
-                self.logger.info(f"✅ OpenAI API connection test successful with model: {model}")
-            except Exception as test_error:
-                self.logger.error(f"❌ OpenAI API test failed: {test_error}")
-                self.logger.warning("⚠️ Will use enhanced fallback text generation")
-                # Don't set client to None here, as we might still be able to use it
-                
+            # Async client on one pooled HTTP client shared by every section call, so concurrent
+            # requests overlap on warm keep-alive connections
+            self._http_client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=self._max_inflight * 2,
+                    max_keepalive_connections=self._max_inflight * 2,
+                    keepalive_expiry=30.0,
+                ),
+            )
+            # Retries are handled per call in _create_completion, so the client's own are disabled
+            self.openai_client = openai.AsyncOpenAI(
+                api_key=api_key,
+                timeout=30.0,
+                max_retries=0,
+                http_client=self._http_client
+            )
+            self.logger.info("✅ OpenAI client initialized")
+            
+            # No test request here - the async client can't be awaited from __init__, and the first
+            # real call surfaces any key or model problem before falling back to template text
+            
         except Exception as e:
             self.logger.error(f"❌ Failed to initialize OpenAI client: {e}")
             self.openai_client = None
     
+    async def aclose(self):
+        """Close the pooled OpenAI HTTP connections - the pool is reused for the generator's lifetime"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self.openai_client = None
+            self.logger.info("🔌 OpenAI HTTP connections closed")
+    
     def _calculate_chronological_age(self, dob_str: str, encounter_date_str: str) -> Dict[str, Any]:
         """Calculate detailed chronological age from DOB and encounter date"""
         try:
@@ -159,6 +726,26 @@ class OpenAIEnhancedReportGenerator:
                 "formatted": "Age calculation unavailable"
             }
     
+    def _load_header_image_reader(self) -> Optional[ImageReader]:
+        """Open the header image once; None when the image is missing"""
+        if not os.path.exists(self._header_image_path):
+            self.logger.warning(f"⚠️ Header image not found: {self._header_image_path}")
+            return None
+        
+        return ImageReader(self._header_image_path)
+    
+    def _get_header_image(self, page_width: float) -> Optional[Image]:
+        """Return a new header Image flowable scaled to the page width - flowables hold per-build
+        layout state, so only the decoded reader is shared between reports"""
+        if self._header_image_reader is None:
+            return None
+        
+        img_width, img_height = self._header_image_reader.getSize()
+        header_image = Image(self._header_image_path, width=page_width, height=page_width * img_height / img_width)
+        # Draw from the preloaded reader so the pixels are decoded once, not per flowable
+        header_image._img = self._header_image_reader
+        return header_image
+    
     def _setup_custom_styles(self):
         """Setup custom paragraph styles with enhanced professional formatting"""
         # Header style for main title - Enhanced with better typography
@@ -166,13 +753,13 @@ class OpenAIEnhancedReportGenerator:
             name='ReportTitle',
             parent=self.styles['Heading1'],
             fontSize=18,
-            textColor=colors.HexColor('#1f4788'),  # Professional blue
+            textColor=_COLOR_PRIMARY,  # Professional blue
             spaceAfter=12,
             spaceBefore=6,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold',
             borderWidth=2,
-            borderColor=colors.HexColor('#1f4788'),
+            borderColor=_COLOR_PRIMARY,
             borderPadding=8,
             leftIndent=0,
             rightIndent=0
@@ -196,15 +783,15 @@ class OpenAIEnhancedReportGenerator:
             name='SectionHeader',
             parent=self.styles['Heading2'],
             fontSize=14,
-            textColor=colors.HexColor('#1f4788'),
+            textColor=_COLOR_PRIMARY,
             spaceAfter=12,
             spaceBefore=20,
             alignment=TA_LEFT,
             fontName='Helvetica-Bold',
             borderWidth=1,
-            borderColor=colors.HexColor('#1f4788'),
+            borderColor=_COLOR_PRIMARY,
             borderPadding=6,
-            backColor=colors.HexColor('#f8f9fa'),
+            backColor=_COLOR_LABEL_BG,
             leftIndent=8,
             rightIndent=8
         ))
@@ -260,7 +847,7 @@ class OpenAIEnhancedReportGenerator:
             name='AssessmentResults',
             parent=self.styles['Normal'],
             fontSize=10,
-            textColor=colors.HexColor('#2d3748'),
+            textColor=_COLOR_LABEL_TEXT,
             spaceAfter=8,
             spaceBefore=4,
             alignment=TA_LEFT,
@@ -268,7 +855,7 @@ class OpenAIEnhancedReportGenerator:
             leading=12,
             leftIndent=12,
             rightIndent=12,
-            backColor=colors.HexColor('#f7fafc'),
+            backColor=_COLOR_ALT_ROW_BG,
             borderWidth=0.5,
             borderColor=colors.HexColor('#e2e8f0'),
             borderPadding=8
@@ -343,7 +930,7 @@ class OpenAIEnhancedReportGenerator:
             name='TableCell',
             parent=self.styles['Normal'],
             fontSize=10,
-            textColor=colors.HexColor('#2d3748'),
+            textColor=_COLOR_LABEL_TEXT,
             spaceAfter=3,
             spaceBefore=3,
             alignment=TA_CENTER,
@@ -351,9 +938,16 @@ class OpenAIEnhancedReportGenerator:
             leading=12
         ))
     
+    def _para(self, text: str, style_name: str) -> Paragraph:
+        """Build a Paragraph in one of the report styles, looked up by name"""
+        return Paragraph(text, self.styles[style_name])
+    
     async def generate_comprehensive_report(self, report_data: Dict[str, Any], session_id: str) -> str:
         """Generate comprehensive professional OT report using OpenAI enhancement"""
         self.logger.info(f"📝 Starting comprehensive report generation for session: {session_id}")
+        # Counters are process-wide, so the report's own hit rate is the difference from this snapshot
+        # (approximate while other reports are generating concurrently)
+        cache_stats_before = get_cache_stats()
         
         # Enhanced data extraction and processing
         enhanced_data = await self._enhance_report_data(report_data)
@@ -383,67 +977,32 @@ class OpenAIEnhancedReportGenerator:
             
             page_width, page_width = doc.pagesize
 
-            img_path = self.config.get_header_image_path()
-            with PILImage.open(img_path) as img:
-                img_width, img_height = img.size
-                aspect_ratio = img_height / img_width
-                scaled_height = page_width * aspect_ratio
-
-            # Create Platypus Image with scaled dimensions
-            header_image = Image(img_path, width=page_width, height=scaled_height)
-
             # Build the report content
             story = []
-            story.extend([header_image, Spacer(1, 12)])
-            
-            # Header section (clinic branding and patient info)
-            self.logger.info("📋 Generating header section...")
-            # story.extend(self._create_professional_header(enhanced_data["patient_info"]))
-            
-            # Main report sections
-            # self.logger.info("📝 Generating background section...")
-            # story.extend(await self._create_background_section(enhanced_data))
-            
-            # self.logger.info("👥 Generating caregiver concerns...")
-            # story.extend(await self._create_caregiver_concerns(enhanced_data))
-            
-            # self.logger.info("👁️ Generating clinical observations...")
-            # story.extend(await self._create_clinical_observations(enhanced_data))
-            
-            # self.logger.info("🔧 Adding assessment tools description...")
-            # story.extend(self._create_assessment_tools_description())
-            
-            self.logger.info("📊 Generating detailed assessment results...")
-            story.extend(await self._create_detailed_assessment_results(enhanced_data))
-            
-            # self.logger.info("💡 Generating recommendations...")
-            # story.extend(await self._create_recommendations_section(enhanced_data))
-            
-            # self.logger.info("📋 Generating professional summary...")
-            # story.extend(await self._create_professional_summary(enhanced_data))
-            
-            # self.logger.info("🎯 Generating OT goals...")
-            # story.extend(await self._create_ot_goals_section(enhanced_data))
-            
-            # self.logger.info("✍️ Adding signature block...")
-            # story.extend(self._create_signature_block())
+            header_image = self._get_header_image(page_width)
+            if header_image is not None:
+                story.extend([header_image, Spacer(1, 12)])
+            await self._build_all_sections(enhanced_data, story)
             
             # Build the PDF
+            # Layout and rendering are CPU-bound - build on the dedicated PDF pool so the event loop
+            # keeps serving and the default executor stays free for file I/O
             self.logger.info("🔨 Building final PDF document...")
-            doc.build(story)
+            await asyncio.get_running_loop().run_in_executor(_PDF_BUILD_EXECUTOR, doc.build, story)
             
-            # Verify file was created
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path) / 1024 / 1024  # MB
-                self.logger.info(f"✅ Report generated successfully: {file_size:.2f} MB")
-            else:
-                raise Exception("PDF file was not created")
+            # doc.build raises if the file can't be written, so no separate existence check is needed
+            self.logger.info(f"✅ Report generated successfully: {output_path}")
+            if is_prompt_cache_enabled():
+                stats = {name: count - cache_stats_before[name] for name, count in get_cache_stats().items()}
+                hits = stats["memory_hits"] + stats["disk_hits"]
+                lookups = hits + stats["misses"]
+                self.logger.info(f"💾 Prompt cache: {hits}/{lookups} hits for this report "
+                                 f"({stats['memory_hits']} from memory)")
             
             return output_path
             
         except Exception as e:
-            print(format_exc())
-            self.logger.error(f"❌ Report generation failed: {e}")
+            self.logger.exception(f"❌ Report generation failed: {e}")
             raise
 
     async def generate_google_docs_report(self, report_data: Dict[str, Any], session_id: str) -> str:
@@ -489,19 +1048,20 @@ class OpenAIEnhancedReportGenerator:
         # Start with enhanced data
         docs_data = enhanced_data.copy()
         
-        # Generate Google Docs specific narratives (more conversational, less clinical)
+        # Google Docs specific narratives (more conversational, less clinical), assessment tables,
+        # recommendations and goals are independent, so they are generated concurrently
         self.logger.info("📝 Generating Google Docs optimized narratives...")
-        docs_narratives = await self._generate_google_docs_narratives(enhanced_data)
-        docs_data["docs_narratives"] = docs_narratives
-        
-        # Format assessment results for Google Docs tables
-        docs_data["formatted_assessments"] = await self._format_assessments_for_docs(enhanced_data)
-        
-        # Generate enhanced recommendations formatted for Google Docs
-        docs_data["enhanced_recommendations"] = await self._generate_enhanced_recommendations_for_docs(enhanced_data)
-        
-        # Generate enhanced goals formatted for Google Docs
-        docs_data["enhanced_goals"] = await self._generate_enhanced_goals_for_docs(enhanced_data)
+        (
+            docs_data["docs_narratives"],
+            docs_data["formatted_assessments"],
+            docs_data["enhanced_recommendations"],
+            docs_data["enhanced_goals"],
+        ) = await asyncio.gather(
+            self._generate_google_docs_narratives(enhanced_data),
+            self._format_assessments_for_docs(enhanced_data),
+            self._generate_enhanced_recommendations_for_docs(enhanced_data),
+            self._generate_enhanced_goals_for_docs(enhanced_data),
+        )
         
         return docs_data
 
@@ -510,8 +1070,6 @@ class OpenAIEnhancedReportGenerator:
         patient_info = enhanced_data.get("patient_info", {})
         assessment_analysis = enhanced_data.get("assessment_analysis", {})
         
-        narratives = {}
-        
         # Background narrative for Google Docs
         background_prompt = f"""
         Create a comprehensive background section for a Google Docs OT report that is professional yet accessible to families.
@@ -530,8 +1088,6 @@ class OpenAIEnhancedReportGenerator:
         Keep the language clear and avoid excessive clinical jargon. This should be understandable to parents while maintaining professional standards.
         """
         
-        narratives["background"] = await self._generate_with_openai(background_prompt, max_tokens=400)
-        
         # Clinical observations narrative for Google Docs
         observations_prompt = f"""
         Create a clinical observations section for a Google Docs OT report.
@@ -549,8 +1105,6 @@ class OpenAIEnhancedReportGenerator:
         Write in a balanced tone that highlights both strengths and areas of concern. Make it family-friendly while maintaining clinical accuracy.
         """
         
-        narratives["clinical_observations"] = await self._generate_with_openai(observations_prompt, max_tokens=400)
-        
         # Professional summary for Google Docs
         summary_prompt = f"""
         Create a professional summary for a Google Docs OT report that synthesizes assessment findings.
@@ -573,7 +1127,25 @@ class OpenAIEnhancedReportGenerator:
         Use professional language that is accessible to families and other team members.
         """
         
-        narratives["professional_summary"] = await self._generate_with_openai(summary_prompt, max_tokens=500)
+        # All three narratives share the system prompt and patient context, so they are packed into
+        # one JSON request; any section missing from the reply falls back to its own template text
+        section_prompts = dict(zip(_DOCS_NARRATIVE_SECTIONS, (background_prompt, observations_prompt, summary_prompt)))
+        combined_prompt = "\n".join(
+            [
+                "Write the following sections for one Google Docs OT report.",
+                "Return a single JSON object with these EXACT keys, each holding that section's text as a string:",
+            ]
+            + [f'"{key}": {section_prompt}' for key, section_prompt in section_prompts.items()]
+        )
+        
+        response = await self._generate_with_openai(
+            combined_prompt, max_tokens=1300, response_format=_DOCS_NARRATIVE_RESPONSE_FORMAT
+        )
+        sections = self._parse_consolidated_response(await remove_lang_tags(response))
+        
+        narratives = {}
+        for key, section_prompt in section_prompts.items():
+            narratives[key] = sections.get(key) or await self._generate_fallback_text(section_prompt)
         
         return narratives
 
@@ -1041,6 +1613,37 @@ class OpenAIEnhancedReportGenerator:
         
         return requests
     
+    async def _build_all_sections(self, enhanced_data: Dict[str, Any], story: List) -> None:
+        """Generate all report sections concurrently and append their flowables to story in report order"""
+        self.logger.info("📝 Generating report sections concurrently...")
+        
+        # Sections are independent, so total latency is the slowest section rather than the sum.
+        # Synchronous builders run in a worker thread so they overlap with the OpenAI calls.
+        section_builders = (
+            # ("Professional header", asyncio.to_thread(self._create_professional_header, enhanced_data["patient_info"])),
+            # ("Background", self._create_background_section(enhanced_data)),
+            # ("Caregiver concerns", self._create_caregiver_concerns(enhanced_data)),
+            # ("Clinical observations", self._create_clinical_observations(enhanced_data)),
+            # ("Assessment tools", asyncio.to_thread(self._create_assessment_tools_description)),
+            ("Assessment results", self._create_detailed_assessment_results(enhanced_data)),
+            # ("Recommendations", self._create_recommendations_section(enhanced_data)),
+            # ("Professional summary", self._create_professional_summary(enhanced_data)),
+            # ("OT goals", self._create_ot_goals_section(enhanced_data)),
+            # ("Signature", asyncio.to_thread(self._create_signature_block)),
+        )
+        # One failed section is replaced with a placeholder instead of aborting the whole PDF
+        sections = await asyncio.gather(*(builder for _, builder in section_builders), return_exceptions=True)
+        
+        for (name, _), section in zip(section_builders, sections):
+            if isinstance(section, BaseException):
+                if not isinstance(section, Exception):
+                    raise section
+                self.logger.error(f"❌ {name} section failed: {section}", exc_info=section)
+                story.append(self._para(f"{name} could not be generated for this report.", 'ClinicalBody'))
+                story.append(Spacer(1, 12))
+                continue
+            story.extend(section)
+    
     async def _enhance_report_data(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
         """Enhance report data with detailed analysis and calculations"""
         enhanced_data = report_data.copy()
@@ -1054,14 +1657,15 @@ class OpenAIEnhancedReportGenerator:
             )
             patient_info["chronological_age"] = chron_age
         
-        # Enhanced clinical notes extraction
-        enhanced_data["clinical_notes"] = await self._extract_clinical_notes(report_data)
-        
         # Enhanced assessment analysis
         enhanced_data["assessment_analysis"] = await self._detailed_assessment_analysis(report_data)
         
-        # Generate ALL narratives in single OpenAI call to save tokens
-        enhanced_data["consolidated_narratives"] = await self._generate_consolidated_report_narratives(enhanced_data)
+        # Clinical notes extraction and the consolidated narratives (ALL narratives in a single
+        # OpenAI call to save tokens) are independent, so both requests run concurrently
+        enhanced_data["clinical_notes"], enhanced_data["consolidated_narratives"] = await asyncio.gather(
+            self._extract_clinical_notes(report_data),
+            self._generate_consolidated_report_narratives(enhanced_data),
+        )
         
         return enhanced_data
     
@@ -1181,40 +1785,7 @@ class OpenAIEnhancedReportGenerator:
     
     def _get_domain_functional_implications(self, domain: str, range_class: str) -> str:
         """Get domain-specific functional implications"""
-        implications = {
-            "Cognitive": {
-                "Above Average": "demonstrates advanced problem-solving, memory, and learning abilities with strong visual processing skills",
-                "Average": "shows age-appropriate cognitive processing, problem-solving, and learning capacity",
-                "Below Average": "experiences mild challenges in problem-solving and cognitive processing that may impact learning",
-                "Extremely Low": "demonstrates significant cognitive delays requiring intensive intervention support"
-            },
-            "Receptive Communication": {
-                "Above Average": "exceptional language comprehension with advanced understanding of instructions and vocabulary",
-                "Average": "age-appropriate understanding of spoken language and ability to follow instructions",
-                "Below Average": "mild difficulties understanding spoken language and following complex instructions",
-                "Extremely Low": "significant language comprehension delays affecting daily communication and learning"
-            },
-            "Expressive Communication": {
-                "Above Average": "advanced verbal expression with rich vocabulary and complex sentence formation",
-                "Average": "age-appropriate verbal expression and communication skills",
-                "Below Average": "limited verbal expression that may impact social communication",
-                "Extremely Low": "severe expressive language delays requiring intensive speech therapy intervention"
-            },
-            "Fine Motor": {
-                "Above Average": "exceptional hand-eye coordination and manipulation skills beyond age expectations",
-                "Average": "age-appropriate fine motor control and manipulation abilities",
-                "Below Average": "mild fine motor delays that may impact self-care and pre-academic skills",
-                "Extremely Low": "significant fine motor delays affecting daily living skills and academic readiness"
-            },
-            "Gross Motor": {
-                "Above Average": "advanced gross motor coordination, balance, and movement skills",
-                "Average": "age-appropriate gross motor development and movement patterns",
-                "Below Average": "mild gross motor delays that may impact mobility and play participation",
-                "Extremely Low": "significant gross motor delays requiring intensive physical therapy intervention"
-            }
-        }
-        
-        return implications.get(domain, {}).get(range_class, f"requires further assessment in {domain} domain")
+        return _DOMAIN_IMPLICATIONS.get(domain, {}).get(range_class, f"requires further assessment in {domain} domain")
     
     async def _analyze_sp2_detailed(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
         """Detailed SP2 analysis with real-world implications"""
@@ -1251,39 +1822,19 @@ class OpenAIEnhancedReportGenerator:
     
     def _interpret_sp2_seeking(self, score: int) -> str:
         """Interpret SP2 seeking score with clinical implications"""
-        if score > 60:
-            return "High sensory seeking behaviors - actively seeks intense sensory input, may appear restless or constantly moving"
-        elif score > 40:
-            return "Typical sensory seeking - appropriate interest in sensory experiences"
-        else:
-            return "Low sensory seeking - limited interest in sensory exploration, may appear withdrawn from sensory experiences"
+        return _SP2_SEEKING[bisect_left(_SP2_THRESHOLDS, score)]
     
     def _interpret_sp2_avoiding(self, score: int) -> str:
         """Interpret SP2 avoiding score with clinical implications"""
-        if score > 60:
-            return "High sensory avoiding - actively avoids sensory input, may be overwhelmed by everyday sensations"
-        elif score > 40:
-            return "Typical sensory avoiding - appropriate behavioral responses to overwhelming sensory input"
-        else:
-            return "Low sensory avoiding - tolerates most sensory experiences well"
+        return _SP2_AVOIDING[bisect_left(_SP2_THRESHOLDS, score)]
     
     def _interpret_sp2_sensitivity(self, score: int) -> str:
         """Interpret SP2 sensitivity score with clinical implications"""
-        if score > 60:
-            return "High sensory sensitivity - notices sensory input others miss, easily distracted by background stimuli"
-        elif score > 40:
-            return "Typical sensory sensitivity - notices sensory input at expected levels"
-        else:
-            return "Low sensory sensitivity - may miss subtle sensory cues in environment"
+        return _SP2_SENSITIVITY[bisect_left(_SP2_THRESHOLDS, score)]
     
     def _interpret_sp2_registration(self, score: int) -> str:
         """Interpret SP2 registration score with clinical implications"""
-        if score > 60:
-            return "High registration challenges - misses important sensory information, appears unaware of sensory input"
-        elif score > 40:
-            return "Typical sensory registration - notices relevant sensory information appropriately"
-        else:
-            return "Good sensory registration - consistently notices and responds to sensory input"
+        return _SP2_REGISTRATION[bisect_left(_SP2_THRESHOLDS, score)]
     
     def _get_sp2_real_world_implications(self, seeking: int, avoiding: int, sensitivity: int, registration: int) -> List[str]:
         """Get real-world implications for SP2 scores"""
@@ -1322,9 +1873,7 @@ class OpenAIEnhancedReportGenerator:
         
         if chomps_data:
             # Analyze each domain
-            domains = ["oral_motor", "oral_sensory", "behavioral", "pharyngeal", "esophageal"]
-            
-            for domain in domains:
+            for domain in _CHOMPS_DOMAINS:
                 if domain in chomps_data:
                     score = chomps_data[domain]
                     analysis["domain_scores"][domain] = score
@@ -1340,33 +1889,30 @@ class OpenAIEnhancedReportGenerator:
     
     def _get_chomps_concern_level(self, score: int) -> str:
         """Get ChOMPS concern level based on score"""
-        if score >= 7:
-            return "High concern - significant feeding difficulties requiring immediate intervention"
-        elif score >= 4:
-            return "Moderate concern - feeding challenges that warrant monitoring and intervention"
-        elif score >= 2:
-            return "Mild concern - minor feeding difficulties that may benefit from strategies"
-        else:
-            return "No concern - typical feeding behaviors for age"
+        return _CHOMPS_CONCERN_LEVELS[bisect_right(_CHOMPS_CONCERN_THRESHOLDS, score)]
     
     def _assess_chomps_feeding_risks(self, chomps_data: Dict) -> List[str]:
         """Assess specific feeding risks from ChOMPS data"""
         risks = []
+        oral_motor = chomps_data.get("oral_motor", 0)
+        oral_sensory = chomps_data.get("oral_sensory", 0)
+        behavioral = chomps_data.get("behavioral", 0)
+        pharyngeal = chomps_data.get("pharyngeal", 0)
         
         # Bolus control risks
-        if chomps_data.get("oral_motor", 0) >= 4:
+        if oral_motor >= 4:
             risks.append("Bolus control: Difficulty managing food bolus, risk of pocketing or spillage")
         
         # Gagging risks
-        if chomps_data.get("oral_sensory", 0) >= 4:
+        if oral_sensory >= 4:
             risks.append("Gagging: Heightened gag response to textures, limiting food variety and intake")
         
         # Food hoarding risks
-        if chomps_data.get("behavioral", 0) >= 4:
+        if behavioral >= 4:
             risks.append("Food hoarding: Behavioral feeding patterns including food refusal or hoarding behaviors")
         
         # Swallowing safety
-        if chomps_data.get("pharyngeal", 0) >= 4:
+        if pharyngeal >= 4:
             risks.append("Swallowing safety: Potential aspiration risk requiring modified textures and positioning")
         
         return risks
@@ -1420,49 +1966,31 @@ class OpenAIEnhancedReportGenerator:
     
     def _interpret_pedieat_physiology(self, score: int) -> str:
         """Interpret PediEAT physiology domain"""
-        if score > 14:
-            return "Elevated physiological symptoms - significant concerns with growth, medical complexity, or physical function during meals"
-        elif score > 7:
-            return "Moderate physiological symptoms - some concerns with physical aspects of eating and growth"
-        else:
-            return "Typical physiological function - no significant concerns with physical eating processes"
+        return _PEDIEAT_PHYSIOLOGY[bisect_left(_PEDIEAT_THRESHOLDS, score)]
     
     def _interpret_pedieat_processing(self, score: int) -> str:
         """Interpret PediEAT processing domain"""
-        if score > 14:
-            return "Elevated processing symptoms - significant sensory processing challenges affecting eating and mealtime participation"
-        elif score > 7:
-            return "Moderate processing symptoms - some sensory processing differences impacting food acceptance"
-        else:
-            return "Typical sensory processing - appropriate sensory responses during eating"
+        return _PEDIEAT_PROCESSING[bisect_left(_PEDIEAT_THRESHOLDS, score)]
     
     def _interpret_pedieat_behavior(self, score: int) -> str:
         """Interpret PediEAT mealtime behavior domain"""
-        if score > 14:
-            return "Elevated behavioral symptoms - significant challenging behaviors during mealtimes affecting family dynamics"
-        elif score > 7:
-            return "Moderate behavioral symptoms - some challenging mealtime behaviors requiring strategies"
-        else:
-            return "Typical mealtime behaviors - appropriate social engagement and cooperation during meals"
+        return _PEDIEAT_BEHAVIOR[bisect_left(_PEDIEAT_THRESHOLDS, score)]
     
     def _interpret_pedieat_selectivity(self, score: int) -> str:
         """Interpret PediEAT selectivity domain"""
-        if score > 14:
-            return "Elevated selectivity symptoms - severe food selectivity limiting nutritional intake and food variety"
-        elif score > 7:
-            return "Moderate selectivity symptoms - some food preferences and limitations affecting meal planning"
-        else:
-            return "Typical food selectivity - age-appropriate food preferences and acceptance"
+        return _PEDIEAT_SELECTIVITY[bisect_left(_PEDIEAT_THRESHOLDS, score)]
     
     def _assess_pedieat_safety(self, pedieat_data: Dict) -> List[str]:
         """Assess safety concerns from PediEAT data"""
         concerns = []
+        physiology = pedieat_data.get("physiology", 0)
+        mealtime_behavior = pedieat_data.get("mealtime_behavior", 0)
         
-        if pedieat_data.get("physiology", 0) > 12:
+        if physiology > 12:
             concerns.append("Nutritional safety: Risk of inadequate caloric or nutrient intake")
             concerns.append("Growth concerns: May require nutritional monitoring and intervention")
         
-        if pedieat_data.get("mealtime_behavior", 0) > 12:
+        if mealtime_behavior > 12:
             concerns.append("Mealtime safety: Behavioral challenges may impact safe food consumption")
         
         return concerns
@@ -1482,29 +2010,34 @@ class OpenAIEnhancedReportGenerator:
         elements = []
         
         # Main title
-        header = Paragraph("Assessment Results and Clinical Interpretation", 
-                          self.styles['SectionHeader'])
+        header = self._para("Assessment Results and Clinical Interpretation", 'SectionHeader')
         elements.append(header)
         elements.append(Spacer(1, 8))
         
         # Get assessment analysis
         assessment_analysis = report_data.get("assessment_analysis", {})
         
+        # Per-assessment sections are generated concurrently and kept in report order
+        subsections = []
+        
         # Bayley-4 detailed results
         # if assessment_analysis.get("bayley4"):
-        #     elements.extend(await self._create_bayley4_detailed_section(report_data))
+        #     subsections.append(self._create_bayley4_detailed_section(report_data))
         
         # # SP2 detailed results
         # if assessment_analysis.get("sp2"):
-        #     elements.extend(await self._create_sp2_detailed_section(report_data))
+        #     subsections.append(self._create_sp2_detailed_section(report_data))
         
         # ChOMPS detailed results
         if assessment_analysis.get("chomps"):
-            elements.extend(await self._create_chomps_detailed_section(report_data))
+            subsections.append(self._create_chomps_detailed_section(report_data))
         
         # PediEAT detailed results  
         # if assessment_analysis.get("pedieat"):
-        #     elements.extend(await self._create_pedieat_detailed_section(report_data))
+        #     subsections.append(self._create_pedieat_detailed_section(report_data))
+        
+        for section in await asyncio.gather(*subsections):
+            elements.extend(section)
         
         return elements
     
@@ -1513,8 +2046,7 @@ class OpenAIEnhancedReportGenerator:
         elements = []
         
         # Bayley-4 header with enhanced styling
-        header = Paragraph("Bayley Scales of Infant and Toddler Development - Fourth Edition (Bayley-4)", 
-                          self.styles['DomainHeader'])
+        header = self._para("Bayley Scales of Infant and Toddler Development - Fourth Edition (Bayley-4)", 'DomainHeader')
         elements.append(header)
         elements.append(Spacer(1, 8))
         
@@ -1523,25 +2055,33 @@ class OpenAIEnhancedReportGenerator:
         bayley_cognitive = extracted_data.get("bayley4_cognitive", {})
         bayley_social = extracted_data.get("bayley4_social", {})
         
+        # Skip the OpenAI call entirely when nothing was extracted
+        if not (bayley_cognitive or bayley_social):
+            elements.append(self._para("Not administered.", 'ClinicalBody'))
+            elements.append(Spacer(1, 12))
+            return elements
+        
         # Create professional scores table if we have data
         if bayley_cognitive.get("raw_scores") or bayley_social.get("raw_scores"):
             
             # Scores table header
-            score_header = Paragraph("Assessment Scores Summary", self.styles['KeyFindings'])
+            score_header = self._para("Assessment Scores Summary", 'KeyFindings')
             elements.append(score_header)
             elements.append(Spacer(1, 6))
             
             # Build comprehensive scores table
             score_data = [
                 # Table headers with enhanced styling
-                [Paragraph("Domain", self.styles['TableHeader']),
-                 Paragraph("Raw Score", self.styles['TableHeader']),
-                 Paragraph("Scaled Score", self.styles['TableHeader']),
-                 Paragraph("Percentile", self.styles['TableHeader']),
-                 Paragraph("Age Equivalent", self.styles['TableHeader']),
-                 Paragraph("Classification", self.styles['TableHeader'])]
+                [self._para("Domain", 'TableHeader'),
+                 self._para("Raw Score", 'TableHeader'),
+                 self._para("Scaled Score", 'TableHeader'),
+                 self._para("Percentile", 'TableHeader'),
+                 self._para("Age Equivalent", 'TableHeader'),
+                 self._para("Classification", 'TableHeader')]
             ]
             
+            cell_style = self.styles['TableCell']
+            
             # Add cognitive/language/motor scores if available
             if bayley_cognitive.get("raw_scores"):
                 cog_scores = bayley_cognitive["raw_scores"]
@@ -1551,12 +2091,12 @@ class OpenAIEnhancedReportGenerator:
                         percentile = self._score_to_percentile(scores.get("scaled_score", 0))
                         
                         score_data.append([
-                            Paragraph(f"<b>{domain.title()}</b>", self.styles['TableCell']),
-                            Paragraph(str(scores.get("raw_score", "N/A")), self.styles['TableCell']),
-                            Paragraph(str(scores.get("scaled_score", "N/A")), self.styles['TableCell']),
-                            Paragraph(f"{percentile}%", self.styles['TableCell']),
-                            Paragraph(scores.get("age_equivalent", "N/A"), self.styles['TableCell']),
-                            Paragraph(classification, self.styles['TableCell'])
+                            Paragraph(f"<b>{domain.title()}</b>", cell_style),
+                            Paragraph(str(scores.get("raw_score", "N/A")), cell_style),
+                            Paragraph(str(scores.get("scaled_score", "N/A")), cell_style),
+                            Paragraph(f"{percentile}%", cell_style),
+                            Paragraph(scores.get("age_equivalent", "N/A"), cell_style),
+                            Paragraph(classification, cell_style)
                         ])
             
             # Add social-emotional/adaptive scores if available
@@ -1568,12 +2108,12 @@ class OpenAIEnhancedReportGenerator:
                         percentile = self._score_to_percentile(scores.get("scaled_score", 0))
                         
                         score_data.append([
-                            Paragraph(f"<b>{domain.replace('_', ' ').title()}</b>", self.styles['TableCell']),
-                            Paragraph(str(scores.get("raw_score", "N/A")), self.styles['TableCell']),
-                            Paragraph(str(scores.get("scaled_score", "N/A")), self.styles['TableCell']),
-                            Paragraph(f"{percentile}%", self.styles['TableCell']),
-                            Paragraph(scores.get("age_equivalent", "N/A"), self.styles['TableCell']),
-                            Paragraph(classification, self.styles['TableCell'])
+                            Paragraph(f"<b>{domain.replace('_', ' ').title()}</b>", cell_style),
+                            Paragraph(str(scores.get("raw_score", "N/A")), cell_style),
+                            Paragraph(str(scores.get("scaled_score", "N/A")), cell_style),
+                            Paragraph(f"{percentile}%", cell_style),
+                            Paragraph(scores.get("age_equivalent", "N/A"), cell_style),
+                            Paragraph(classification, cell_style)
                         ])
             
             # Create the scores table with professional styling
@@ -1581,38 +2121,7 @@ class OpenAIEnhancedReportGenerator:
                                colWidths=[1.4*inch, 0.8*inch, 0.9*inch, 0.8*inch, 1.0*inch, 1.5*inch])
             
             # Enhanced table styling
-            scores_table.setStyle(TableStyle([
-                # Header row styling
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f4788')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                
-                # Data rows styling
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#2d3748')),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('ALIGN', (1, 1), (-1, -1), 'CENTER'),  # Center all except domain names
-                ('ALIGN', (0, 1), (0, -1), 'LEFT'),     # Left align domain names
-                
-                # Borders and grid
-                ('GRID', (0, 0), (-1, -1), 0.75, colors.HexColor('#cbd5e0')),
-                ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#1f4788')),
-                
-                # Padding
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('LEFTPADDING', (0, 0), (-1, -1), 8),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-                
-                # Alternating row colors for better readability
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
-                
-                # Highlight low scores in red
-                ('TEXTCOLOR', (2, 1), (2, -1), colors.HexColor('#e53e3e')),  # Scaled scores
-            ]))
+            scores_table.setStyle(_SCORE_TABLE_STYLE)
             
             elements.append(scores_table)
             elements.append(Spacer(1, 16))
@@ -1625,28 +2134,13 @@ class OpenAIEnhancedReportGenerator:
         bayley_analysis = report_data.get("assessment_analysis", {}).get("bayley4", {})
         
         # Generate comprehensive Bayley interpretation
-        bayley_prompt = f"""
-        Write a comprehensive Bayley-4 assessment interpretation for a pediatric OT report.
-        
-        Patient chronological age: {chronological_age.get('formatted', 'Not available')}
-        
-        Assessment Analysis: {bayley_analysis}
-        
-        Requirements:
-        - Include specific scaled scores, age equivalents, and percentile rankings
-        - Calculate and report percentage delays where applicable
-        - Compare performance to chronological age expectations
-        - Include range classifications (extremely low, below average, average, above average)
-        - Link findings to observed functional limitations
-        - Describe specific tasks and child's performance
-        - Use professional clinical language
-        - Provide detailed interpretation for each domain tested
-        - Include implications for intervention planning
-        
-        Write as detailed clinical narrative covering all tested domains with specific scores and interpretations.
-        """
+        bayley_prompt = (
+            f"{_BAYLEY_INSTRUCTIONS}\n"
+            f"Patient chronological age: {chronological_age.get('formatted', 'Not available')}\n"
+            f"Assessment Analysis: {_compact_json(bayley_analysis)}\n"
+        )
         
-        bayley_narrative = await self._generate_with_openai(bayley_prompt, max_tokens=800)
+        bayley_narrative = await self._generate_with_openai(bayley_prompt, max_tokens=800, prompt_cache_key="bayley4")
         
         narrative_para = Paragraph(bayley_narrative, self.styles['ClinicalBody'])
         elements.append(narrative_para)
@@ -1656,60 +2150,35 @@ class OpenAIEnhancedReportGenerator:
     
     def _get_score_classification(self, scaled_score: int) -> str:
         """Get classification for scaled scores"""
-        if scaled_score >= 16:
-            return "Above Average"
-        elif scaled_score >= 8:
-            return "Average"
-        elif scaled_score >= 4:
-            return "Below Average"
-        else:
-            return "Extremely Low"
+        return _CLASSIFICATION_LABELS[bisect_right(_CLASSIFICATION_THRESHOLDS, scaled_score)]
     
     def _score_to_percentile(self, scaled_score: int) -> int:
         """Convert scaled score to approximate percentile"""
         # Simplified conversion - in real implementation you'd use norm tables
-        if scaled_score >= 16:
-            return 85
-        elif scaled_score >= 13:
-            return 75
-        elif scaled_score >= 8:
-            return 50
-        elif scaled_score >= 4:
-            return 25
-        else:
-            return 5
+        return _PERCENTILE_VALUES[bisect_right(_PERCENTILE_THRESHOLDS, scaled_score)]
     
     async def _create_sp2_detailed_section(self, report_data: Dict[str, Any]) -> List:
         """Create detailed SP2 section with real-world implications"""
         elements = []
         
         # SP2 header
-        header = Paragraph("Sensory Profile 2 (SP2)", self.styles['DomainHeader'])
+        header = self._para("Sensory Profile 2 (SP2)", 'DomainHeader')
         elements.append(header)
         elements.append(Spacer(1, 6))
         
+        # Skip the OpenAI call entirely when nothing was extracted
+        if not report_data.get("extracted_data", {}).get("sp2"):
+            elements.append(self._para("Not administered.", 'ClinicalBody'))
+            elements.append(Spacer(1, 12))
+            return elements
+        
         # SP2 analysis data
         sp2_analysis = report_data.get("assessment_analysis", {}).get("sp2", {})
         
         # Generate SP2 interpretation
-        sp2_prompt = f"""
-        Write a detailed Sensory Profile 2 (SP2) interpretation for a pediatric OT report.
-        
-        SP2 Analysis: {sp2_analysis}
-        
-        Requirements:
-        - Explain Seeking, Avoiding, Sensitivity, and Registration scores
-        - Include specific score interpretations and quadrant analysis
-        - Provide real-world implications for grooming, play, and feeding
-        - Describe sensory processing patterns and their impact
-        - Include recommendations for sensory strategies
-        - Use professional sensory integration terminology
-        - Connect findings to functional performance in daily activities
-        
-        Focus on how sensory processing affects daily living skills and participation.
-        """
+        sp2_prompt = f"{_SP2_INSTRUCTIONS}\nSP2 Analysis: {_compact_json(sp2_analysis)}\n"
         
-        sp2_narrative = await self._generate_with_openai(sp2_prompt, max_tokens=600)
+        sp2_narrative = await self._generate_with_openai(sp2_prompt, max_tokens=600, prompt_cache_key="sp2")
         
         narrative_para = Paragraph(sp2_narrative, self.styles['ClinicalBody'])
         elements.append(narrative_para)
@@ -1717,33 +2186,41 @@ class OpenAIEnhancedReportGenerator:
         
         return elements
     
+    async def _generate_json_section(self, prompt: str, *, file_name: str, label: str, max_tokens: int) -> List:
+        """Generate a JSON-formatted section, save the response and convert it to flowables"""
+        response = await self._generate_with_openai(prompt, max_tokens=max_tokens, prompt_cache_key=file_name)
+        response = await remove_lang_tags(response)
+        try:
+            parsed = orjson.loads(response)
+        except orjson.JSONDecodeError as e:
+            save_response_in_background(response, file_name=file_name, json_format=False)
+            # Logged once, with the traceback, by _build_all_sections when it replaces the section
+            raise ValueError(f"{label} response is not valid JSON") from e
+        else:
+            save_response_in_background(parsed, file_name=file_name, json_format=True)
+        return await format_data_for_pdf(parsed)
+    
     async def _create_chomps_detailed_section(self, report_data: Dict[str, Any]) -> List:
         """Create detailed ChOMPS section with feeding risk assessment"""
         elements = []
         
         # ChOMPS header
-        header = Paragraph("Chicago Oral Motor and Swallowing Scale (ChOMPS)", 
-                          self.styles['DomainHeader'])
+        header = self._para("Chicago Oral Motor and Swallowing Scale (ChOMPS)", 'DomainHeader')
         elements.append(header)
         elements.append(Spacer(1, 6))
         
+        # Skip the OpenAI call entirely when nothing was extracted
+        if not report_data.get("extracted_data", {}).get("chomps"):
+            elements.append(self._para("Not administered.", 'ClinicalBody'))
+            elements.append(Spacer(1, 12))
+            return elements
+        
         # ChOMPS analysis data
         chomps_analysis = report_data.get("assessment_analysis", {}).get("chomps", {})
         
         # Generate ChOMPS interpretation
-        chomps_prompt = await get_prompt(prompt_type="chomps", data=chomps_analysis, json_format=True)
-        chomps_narrative = await self._generate_with_openai(chomps_prompt, max_tokens=2000)
-        chomps_narrative = await remove_lang_tags(chomps_narrative)
-        try:
-            chomps_narrative = json.loads(chomps_narrative)
-            await save_response(chomps_narrative, file_name="chomps", json_format=True)
-        except json.JSONDecodeError as e:
-            print(format_exc())
-            await save_response(chomps_narrative, file_name="chomps", json_format=True)
-            self.logger.error(f"❌ ChOMPS response parsing failed: {e}")
-            raise
-        body = await format_data_for_pdf(chomps_narrative)
-        elements.extend(body)
+        chomps_prompt = await self._prompt_chomps(data=_compact_json(chomps_analysis))
+        elements.extend(await self._generate_json_section(chomps_prompt, file_name="chomps", label="ChOMPS", max_tokens=2000))
         
         # narrative_para = Paragraph(chomps_narrative, self.styles['ClinicalBody'])
         # elements.append(narrative_para)
@@ -1756,15 +2233,20 @@ class OpenAIEnhancedReportGenerator:
         elements = []
         
         # PediEAT header
-        header = Paragraph("Pediatric Eating Assessment Tool (PediEAT)", 
-                          self.styles['DomainHeader'])
+        header = self._para("Pediatric Eating Assessment Tool (PediEAT)", 'DomainHeader')
         elements.append(header)
         elements.append(Spacer(1, 6))
         
+        # Skip the OpenAI call entirely when nothing was extracted
+        if not report_data.get("extracted_data", {}).get("pedieat"):
+            elements.append(self._para("Not administered.", 'ClinicalBody'))
+            elements.append(Spacer(1, 12))
+            return elements
+        
         # PediEAT analysis data
         pedieat_analysis = report_data.get("assessment_analysis", {}).get("pedieat", {})
         
-        pedieat_prompt = await get_prompt(prompt_type="pedieat", data=pedieat_analysis, json_format=True)
+        pedieat_prompt = await self._prompt_pedieat(data=_compact_json(pedieat_analysis))
 
         # def parse_pedieat_report(text):
         #     """
@@ -1822,12 +2304,7 @@ class OpenAIEnhancedReportGenerator:
         # elements.extend(story)
         # elements.append(Spacer(1, 12))
 
-        pedieat_response = await self._generate_with_openai(pedieat_prompt, max_tokens=1000)
-        pedieat_response = await remove_lang_tags(pedieat_response)
-        pedieat_response = json.loads(pedieat_response)
-        await save_response(pedieat_response, file_name="pedieat", json_format=True)
-        body = await format_data_for_pdf(pedieat_response)
-        elements.extend(body)
+        elements.extend(await self._generate_json_section(pedieat_prompt, file_name="pedieat", label="PediEAT", max_tokens=1000))
         
         return elements
     
@@ -1836,12 +2313,12 @@ class OpenAIEnhancedReportGenerator:
         elements = []
         
         # Enhanced recommendations header
-        header = Paragraph("Clinical Recommendations", self.styles['SectionHeader'])
+        header = self._para("Clinical Recommendations", 'SectionHeader')
         elements.append(header)
         elements.append(Spacer(1, 10))
         
         # Generate recommendations using OpenAI or fallback
-        recommendations = await self._generate_recommendations(report_data)
+        recommendations = await self._generate_recommendations_optimized(report_data)
         
         if recommendations:
             # Introduction paragraph
@@ -1854,41 +2331,35 @@ class OpenAIEnhancedReportGenerator:
             elements.append(Spacer(1, 12))
             
             # Priority recommendations header
-            priority_header = Paragraph("Priority Intervention Areas", self.styles['KeyFindings'])
+            priority_header = self._para("Priority Intervention Areas", 'KeyFindings')
             elements.append(priority_header)
             elements.append(Spacer(1, 8))
             
-            # Process and format each recommendation with enhanced styling
-            for i, recommendation in enumerate(recommendations[:3], 1):  # Top 3 as priority
+            # Process and format each recommendation - top 3 as priority, the rest as additional
+            priority_style = self.styles['RecommendationItem']
+            additional_style = self.styles['ClinicalBody']
+            for i, recommendation in enumerate(recommendations, 1):
+                if i == 4:
+                    # Additional recommendations header, emitted only if there are more than 3
+                    elements.append(self._para("Additional Considerations", 'DomainHeader'))
+                    elements.append(Spacer(1, 8))
+                
                 # Clean and format recommendation text
                 clean_rec = recommendation.strip().lstrip('•-').strip()
                 if not clean_rec.endswith('.'):
                     clean_rec += '.'
                 
                 formatted_rec = f"<b>{i}.</b> {clean_rec}"
-                rec_para = Paragraph(formatted_rec, self.styles['RecommendationItem'])
-                elements.append(rec_para)
-                elements.append(Spacer(1, 6))
-            
-            # Additional recommendations if available
-            if len(recommendations) > 3:
-                additional_header = Paragraph("Additional Considerations", self.styles['DomainHeader'])
-                elements.append(additional_header)
-                elements.append(Spacer(1, 8))
-                
-                for i, recommendation in enumerate(recommendations[3:], 4):
-                    clean_rec = recommendation.strip().lstrip('•-').strip()
-                    if not clean_rec.endswith('.'):
-                        clean_rec += '.'
-                    
-                    formatted_rec = f"<b>{i}.</b> {clean_rec}"
-                    rec_para = Paragraph(formatted_rec, self.styles['ClinicalBody'])
-                    elements.append(rec_para)
+                if i <= 3:
+                    elements.append(Paragraph(formatted_rec, priority_style))
+                    elements.append(Spacer(1, 6))
+                else:
+                    elements.append(Paragraph(formatted_rec, additional_style))
                     elements.append(Spacer(1, 4))
             
             # Service frequency recommendation with highlighting
             elements.append(Spacer(1, 12))
-            frequency_header = Paragraph("Recommended Service Frequency", self.styles['KeyFindings'])
+            frequency_header = self._para("Recommended Service Frequency", 'KeyFindings')
             elements.append(frequency_header)
             elements.append(Spacer(1, 6))
             
@@ -1917,17 +2388,18 @@ class OpenAIEnhancedReportGenerator:
         elements = []
         
         # Section header
-        header = Paragraph("Occupational Therapy Goals", self.styles['SectionHeader'])
+        header = self._para("Occupational Therapy Goals", 'SectionHeader')
         elements.append(header)
         elements.append(Spacer(1, 8))
         
         # Generate goals using helper method
-        goals = await self._generate_ot_goals(report_data)
+        goals = await self._generate_ot_goals_optimized(report_data)
         
         # Add each goal as a paragraph
+        body_style = self.styles['ClinicalBody']
         for i, goal in enumerate(goals, 1):
             goal_text = f"{i}. {goal}"
-            goal_para = Paragraph(goal_text, self.styles['ClinicalBody'])
+            goal_para = Paragraph(goal_text, body_style)
             elements.append(goal_para)
             elements.append(Spacer(1, 6))
         
@@ -1949,7 +2421,9 @@ class OpenAIEnhancedReportGenerator:
         
         Format each goal as a complete sentence with specific metrics."""
         
-        goals_text = await self._generate_with_openai(prompt, max_tokens=400)
+        goals_text = await self._generate_with_openai(
+            prompt, max_tokens=_SECTION_MAX_TOKENS["goals"], prompt_cache_key="goals"
+        )
         
         # Parse goals or use defaults
         if "Within" in goals_text:
@@ -1969,19 +2443,19 @@ class OpenAIEnhancedReportGenerator:
         elements = []
         
         # Enhanced FMRC Health Group header with improved styling
-        title = Paragraph("FMRC Health Group", self.styles['ReportTitle'])
+        title = self._para("FMRC Health Group", 'ReportTitle')
         elements.append(title)
         
-        subtitle = Paragraph("Occupational Therapy Developmental Evaluation", self.styles['ClinicInfo'])
+        subtitle = self._para("Occupational Therapy Developmental Evaluation", 'ClinicInfo')
         elements.append(subtitle)
         
-        vendor = Paragraph("Vendor #PW8583", self.styles['ClinicInfo'])
+        vendor = self._para("Vendor #PW8583", 'ClinicInfo')
         elements.append(vendor)
         
-        address = Paragraph("1626 Centinela Ave, Suite 108, Inglewood CA 90302", self.styles['ClinicInfo'])
+        address = self._para("1626 Centinela Ave, Suite 108, Inglewood CA 90302", 'ClinicInfo')
         elements.append(address)
         
-        website = Paragraph("www.fmrchealth.com", self.styles['ClinicInfo'])
+        website = self._para("www.fmrchealth.com", 'ClinicInfo')
         elements.append(website)
         
         elements.append(Spacer(1, 24))
@@ -1996,57 +2470,19 @@ class OpenAIEnhancedReportGenerator:
             ["", "", "Date of Encounter:", patient_info.get("encounter_date", "")]
         ]
         
-        patient_table = Table(patient_data, colWidths=[1.6*inch, 2.2*inch, 1.6*inch, 2.2*inch])
+        # Fixed column widths and a prebuilt style - only the row heights are measured per report
+        patient_table = Table(patient_data, colWidths=_PATIENT_COL_WIDTHS)
         
         # Enhanced table styling with professional colors and borders
-        patient_table.setStyle(TableStyle([
-            # Background colors for better visual hierarchy
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),  # Label columns
-            ('BACKGROUND', (2, 0), (2, -1), colors.HexColor('#f8f9fa')),  # Label columns
-            ('BACKGROUND', (1, 0), (1, -1), colors.white),  # Data columns
-            ('BACKGROUND', (3, 0), (3, -1), colors.white),  # Data columns
-            
-            # Text alignment and fonts
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            
-            # Font styling
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),  # Label columns bold
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),  # Label columns bold
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),       # Data columns normal
-            ('FONTNAME', (3, 0), (3, -1), 'Helvetica'),       # Data columns normal
-            
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#2d3748')),  # Label color
-            ('TEXTCOLOR', (2, 0), (2, -1), colors.HexColor('#2d3748')),  # Label color
-            ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#1a202c')),  # Data color
-            ('TEXTCOLOR', (3, 0), (3, -1), colors.HexColor('#1a202c')),  # Data color
-            
-            # Padding for better spacing
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            
-            # Borders for professional appearance
-            ('GRID', (0, 0), (-1, -1), 0.75, colors.HexColor('#cbd5e0')),
-            ('LINEBELOW', (0, 0), (-1, 0), 1.5, colors.HexColor('#4a5568')),  # Header underline
-            
-            # Row-specific styling
-            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
-        ]))
+        patient_table.setStyle(_PATIENT_TABLE_STYLE)
         
         elements.append(patient_table)
         elements.append(Spacer(1, 24))
         
         # Add a subtle separator line
-        separator_data = [["" for _ in range(4)]]
-        separator_table = Table(separator_data, colWidths=[7.6*inch])
-        separator_table.setStyle(TableStyle([
-            ('LINEABOVE', (0, 0), (-1, 0), 2, colors.HexColor('#1f4788')),
-            ('TOPPADDING', (0, 0), (-1, -1), 0),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-        ]))
+        # A fresh single-width list each time - ReportLab pads it in place to the data's column count
+        separator_table = Table(_SEPARATOR_DATA, colWidths=[7.6*inch])
+        separator_table.setStyle(_SEPARATOR_TABLE_STYLE)
         elements.append(separator_table)
         elements.append(Spacer(1, 12))
         
@@ -2056,11 +2492,11 @@ class OpenAIEnhancedReportGenerator:
         """Create background information section with OpenAI enhancement"""
         elements = []
         
-        header = Paragraph("Reason for referral and background information", self.styles['SectionHeader'])
+        header = self._para("Reason for referral and background information", 'SectionHeader')
         elements.append(header)
         
         # Use OpenAI to generate professional background narrative
-        background_text = await self._generate_background_narrative(report_data)
+        background_text = await self._generate_background_narrative_optimized(report_data)
         
         background_para = Paragraph(background_text, self.styles['ClinicalBody'])
         elements.append(background_para)
@@ -2072,11 +2508,11 @@ class OpenAIEnhancedReportGenerator:
         """Create caregiver concerns section with OpenAI enhancement"""
         elements = []
         
-        header = Paragraph("Caregiver Concerns", self.styles['SectionHeader'])
+        header = self._para("Caregiver Concerns", 'SectionHeader')
         elements.append(header)
         
         # Generate professional caregiver concerns narrative
-        concerns_text = await self._generate_caregiver_concerns_narrative(report_data)
+        concerns_text = await self._generate_caregiver_concerns_narrative_optimized(report_data)
         
         concerns_para = Paragraph(concerns_text, self.styles['ClinicalBody'])
         elements.append(concerns_para)
@@ -2088,11 +2524,11 @@ class OpenAIEnhancedReportGenerator:
         """Create clinical observations section with OpenAI enhancement"""
         elements = []
         
-        header = Paragraph("Observation", self.styles['SectionHeader'])
+        header = self._para("Observation", 'SectionHeader')
         elements.append(header)
         
         # Generate professional clinical observations
-        observations_text = await self._generate_clinical_observations_narrative(report_data)
+        observations_text = await self._generate_clinical_observations_narrative_optimized(report_data)
         
         observations_para = Paragraph(observations_text, self.styles['ClinicalBody'])
         elements.append(observations_para)
@@ -2104,7 +2540,7 @@ class OpenAIEnhancedReportGenerator:
         """Create assessment tools description section"""
         elements = []
         
-        header = Paragraph("Assessment Tools", self.styles['SectionHeader'])
+        header = self._para("Assessment Tools", 'SectionHeader')
         elements.append(header)
         
         tools_text = ("Bayley Scales of Infant and Toddler Development - Fourth Edition (BSID-4), parent "
@@ -2115,8 +2551,7 @@ class OpenAIEnhancedReportGenerator:
         elements.append(Spacer(1, 8))
         
         # Bayley-4 description
-        bayley_header = Paragraph("Bayley Scales of Infant and Toddler Development - Fourth Edition (BSID-4)", 
-                                 self.styles['SectionHeader'])
+        bayley_header = self._para("Bayley Scales of Infant and Toddler Development - Fourth Edition (BSID-4)", 'SectionHeader')
         elements.append(bayley_header)
         
         bayley_description = """The Bayley Scales of Infant and Toddler Development - Fourth Edition (BSID-4) is a norm-referenced assessment used to evaluate early developmental skills in children from birth to 42 months. It provides standardized scores in the following developmental domains:
@@ -2182,7 +2617,9 @@ class OpenAIEnhancedReportGenerator:
         Write 2-3 sentences maximum, similar to this style: "A developmental evaluation was recommended by the Regional Center to determine [patient name]'s current level of performance and to guide service frequency recommendations for early intervention."
         """
         
-        return await self._generate_with_openai(prompt, max_tokens=150)
+        return await self._generate_with_openai(
+            prompt, max_tokens=_SECTION_MAX_TOKENS["background"], prompt_cache_key="background"
+        )
     
     async def _generate_caregiver_concerns_narrative(self, report_data: Dict[str, Any]) -> str:
         """Generate detailed caregiver concerns narrative using assessment data"""
@@ -2228,7 +2665,9 @@ class OpenAIEnhancedReportGenerator:
         Example style: "Ms. [Parent] expressed broad concerns regarding her daughter's overall development. She noted that [child] becomes easily upset when the iPad is removed, indicating difficulty with transitions and emotional regulation. Ms. [Parent] also reported challenges with [child]'s ability to attend to fine motor tasks and maintain focus during structured activities. Of primary concern is [child]'s speech and language development, which Ms. [Parent] described as significantly delayed compared to same-age peers."
         """
         
-        return await self._generate_with_openai(prompt, max_tokens=400)
+        return await self._generate_with_openai(
+            prompt, max_tokens=_SECTION_MAX_TOKENS["caregiver_concerns"], prompt_cache_key="caregiver_concerns"
+        )
     
     async def _generate_clinical_observations_narrative(self, report_data: Dict[str, Any]) -> str:
         """Generate detailed clinical observations using assessment data"""
@@ -2279,7 +2718,9 @@ class OpenAIEnhancedReportGenerator:
         Example elements to include: muscle tone assessment, attention span observations, task engagement, assistance levels needed, behavioral responses, testing conditions impact.
         """
         
-        return await self._generate_with_openai(prompt, max_tokens=600)
+        return await self._generate_with_openai(
+            prompt, max_tokens=_SECTION_MAX_TOKENS["observations"], prompt_cache_key="observations"
+        )
     
     def _analyze_assessment_concerns(self, bayley_cognitive: Dict, bayley_social: Dict) -> str:
         """Analyze assessment data to identify areas of concern"""
@@ -2287,17 +2728,13 @@ class OpenAIEnhancedReportGenerator:
         
         # Analyze cognitive scores
         if bayley_cognitive.get("scaled_scores"):
-            cognitive_scores = bayley_cognitive["scaled_scores"]
-            for domain, score in cognitive_scores.items():
-                if score < 7:  # Below average range
-                    concerns.append(f"{domain.lower()} development")
+            _, low_domains = _score_stats(bayley_cognitive["scaled_scores"])
+            concerns.extend(f"{domain.lower()} development" for domain in low_domains)
         
         # Analyze social-emotional scores  
         if bayley_social.get("scaled_scores"):
-            social_scores = bayley_social["scaled_scores"]
-            for domain, score in social_scores.items():
-                if score < 7:
-                    concerns.append(f"{domain.lower()} skills")
+            _, low_domains = _score_stats(bayley_social["scaled_scores"])
+            concerns.extend(f"{domain.lower()} skills" for domain in low_domains)
         
         # Default concerns if no scores available
         if not concerns:
@@ -2311,27 +2748,13 @@ class OpenAIEnhancedReportGenerator:
         
         # Analyze cognitive performance
         if bayley_cognitive.get("scaled_scores"):
-            cog_scores = list(bayley_cognitive["scaled_scores"].values())
-            avg_score = sum(cog_scores) / len(cog_scores) if cog_scores else 0
-            
-            if avg_score < 7:
-                patterns.append("below average cognitive-motor performance")
-            elif avg_score > 13:
-                patterns.append("above average cognitive-motor abilities")
-            else:
-                patterns.append("mixed cognitive-motor profile")
+            avg_score, _ = _score_stats(bayley_cognitive["scaled_scores"])
+            patterns.append(_COGNITIVE_PATTERNS[_score_bucket(avg_score)])
         
         # Analyze social-emotional performance
         if bayley_social.get("scaled_scores"):
-            social_scores = list(bayley_social["scaled_scores"].values())
-            avg_score = sum(social_scores) / len(social_scores) if social_scores else 0
-            
-            if avg_score < 7:
-                patterns.append("challenges in social-emotional development")
-            elif avg_score > 13:
-                patterns.append("strengths in social-emotional areas")
-            else:
-                patterns.append("typical social-emotional functioning")
+            avg_score, _ = _score_stats(bayley_social["scaled_scores"])
+            patterns.append(_SOCIAL_PATTERNS[_score_bucket(avg_score)])
         
         return "; ".join(patterns) if patterns else "varied performance across developmental domains"
     
@@ -2344,7 +2767,9 @@ class OpenAIEnhancedReportGenerator:
         - Early intervention services
         Use bullet point format, be specific and professional."""
         
-        recommendations_text = await self._generate_with_openai(prompt, max_tokens=300)
+        recommendations_text = await self._generate_with_openai(
+            prompt, max_tokens=_SECTION_MAX_TOKENS["recommendations"], prompt_cache_key="recommendations"
+        )
         
         # Parse into list or use default
         if "•" in recommendations_text:
@@ -2363,7 +2788,7 @@ class OpenAIEnhancedReportGenerator:
         """Create comprehensive professional summary section"""
         elements = []
         
-        header = Paragraph("Summary:", self.styles['SectionHeader'])
+        header = self._para("Summary:", 'SectionHeader')
         elements.append(header)
         
         # Generate comprehensive summary using enhanced method
@@ -2386,108 +2811,42 @@ class OpenAIEnhancedReportGenerator:
         elements.append(PageBreak())  # Start signature on new page if needed
         
         # Signature header
-        sig_header = Paragraph("Report Prepared By", self.styles['SectionHeader'])
+        sig_header = self._para("Report Prepared By", 'SectionHeader')
         elements.append(sig_header)
         elements.append(Spacer(1, 12))
         
         # Create signature table with professional layout
-        sig_data = [
-            # Signature line
-            ["Signature: ___________________________________", "Date: _______________"],
-            ["", ""],
-            # Professional credentials
-            ["Fushia Crooms, MOT, OTR/L", ""],
-            ["Occupational Therapist", ""],
-            ["License #: OTR/L12345", ""]
-        ]
-        
-        sig_table = Table(sig_data, colWidths=[4.5*inch, 2*inch])
-        sig_table.setStyle(TableStyle([
-            # General styling
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            
-            # Signature line styling
-            ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, 0), 'Helvetica-Bold'),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#2d3748')),
-            
-            # Professional name and credentials
-            ('FONTNAME', (0, 2), (0, 2), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 2), (0, 2), 12),
-            ('TEXTCOLOR', (0, 2), (0, 2), colors.HexColor('#1f4788')),
-            
-            # Title and license
-            ('TEXTCOLOR', (0, 3), (0, 4), colors.HexColor('#4a5568')),
-            ('FONTSIZE', (0, 3), (0, 4), 10),
-            
-            # Padding
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ]))
+        sig_table = Table(_SIGNATURE_DATA, colWidths=_SIGNATURE_COL_WIDTHS)
+        sig_table.setStyle(_SIGNATURE_TABLE_STYLE)
         
         elements.append(sig_table)
         elements.append(Spacer(1, 20))
         
         # Contact information section
-        contact_header = Paragraph("Contact Information", self.styles['DomainHeader'])
+        contact_header = self._para("Contact Information", 'DomainHeader')
         elements.append(contact_header)
         elements.append(Spacer(1, 8))
         
-        # Professional contact information table
-        contact_data = [
-            ["Organization:", "FMRC Health Group"],
-            ["Address:", "1626 Centinela Ave, Suite 108"],
-            ["", "Inglewood, CA 90302"],
-            ["Phone:", "(555) 123-4567"],
-            ["Email:", "fcrooms@fmrchealth.com"],
-            ["Website:", "www.fmrchealth.com"]
-        ]
-        
-        contact_table = Table(contact_data, colWidths=[1.2*inch, 4*inch])
-        contact_table.setStyle(TableStyle([
-            # Background and borders
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f8f9fa')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cbd5e0')),
-            
-            # Text styling
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#2d3748')),
-            ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#1a202c')),
-            
-            # Alignment
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            
-            # Padding
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        # Professional contact information table - data and style are static and shared,
+        # but the Table itself is mutated during layout so each report gets a fresh one
+        contact_table = Table(_CONTACT_DATA, colWidths=_CONTACT_COL_WIDTHS)
+        contact_table.setStyle(_CONTACT_TABLE_STYLE)
         
         elements.append(contact_table)
         elements.append(Spacer(1, 16))
         
-        # Footer disclaimer
-        disclaimer = Paragraph(
-            "<i>This report contains confidential medical information and is intended solely for the use of "
-            "the identified patient and authorized personnel. Distribution or reproduction without written "
-            "consent is prohibited.</i>",
-            self.styles['Footer']
-        )
-        elements.append(disclaimer)
+        # Footer disclaimer - the text is a constant, the Paragraph is new for every report
+        elements.append(self._para(_DISCLAIMER_TEXT, 'Footer'))
         
         return elements
     
     async def _generate_professional_summary(self, report_data: Dict[str, Any]) -> str:
         """Generate comprehensive professional summary"""
+        # The consolidated call already produced a summary - skip a dedicated round trip
+        consolidated_summary = report_data.get("consolidated_narratives", {}).get("summary")
+        if consolidated_summary:
+            return consolidated_summary
+        
         patient_info = report_data.get("patient_info", {})
         child_name = patient_info.get("name", "The child")
         age = patient_info.get("chronological_age", {}).get("formatted", "unknown age")
@@ -2497,12 +2856,8 @@ class OpenAIEnhancedReportGenerator:
         bayley_cognitive = extracted_data.get("bayley4_cognitive", {})
         bayley_social = extracted_data.get("bayley4_social", {})
         
-        # Analyze overall performance pattern
-        overall_analysis = self._generate_overall_performance_analysis(bayley_cognitive, bayley_social)
-        
-        # Identify strengths and needs
-        strengths = self._identify_assessment_strengths(bayley_cognitive, bayley_social)
-        needs = self._identify_assessment_needs(bayley_cognitive, bayley_social)
+        # Analyze overall performance pattern and identify strengths and needs
+        overall_analysis, strengths, needs = self._analyze_assessment_scores(bayley_cognitive, bayley_social)
         
         prompt = f"""
         Write a comprehensive professional "Summary" section for {child_name} ({age}) based on Bayley-4 assessment findings.
@@ -2534,93 +2889,83 @@ class OpenAIEnhancedReportGenerator:
         Focus on evidence-based conclusions and specific recommendations based on actual assessment findings.
         """
         
-        return await self._generate_with_openai(prompt, max_tokens=600)
+        return await self._generate_with_openai(
+            prompt, max_tokens=_SECTION_MAX_TOKENS["summary"], prompt_cache_key="summary"
+        )
     
-    def _generate_overall_performance_analysis(self, bayley_cognitive: Dict, bayley_social: Dict) -> str:
-        """Generate overall performance analysis from assessment scores"""
+    def _analyze_assessment_scores(self, bayley_cognitive: Dict, bayley_social: Dict) -> Tuple[str, str, str]:
+        """Overall performance analysis, strengths and areas of need from one pass over each score set"""
         analysis_points = []
-        
-        # Analyze cognitive domain scores
-        if bayley_cognitive.get("scaled_scores"):
-            cog_scores = list(bayley_cognitive["scaled_scores"].values())
-            avg_cog = sum(cog_scores) / len(cog_scores) if cog_scores else 0
-            
-            if avg_cog < 7:
-                analysis_points.append("significant delays in cognitive-motor domains")
-            elif avg_cog > 13:
-                analysis_points.append("above-average cognitive-motor abilities")
-            else:
-                analysis_points.append("mixed cognitive-motor profile with areas of both strength and need")
-        
-        # Analyze social-emotional scores
-        if bayley_social.get("scaled_scores"):
-            social_scores = list(bayley_social["scaled_scores"].values())
-            avg_social = sum(social_scores) / len(social_scores) if social_scores else 0
-            
-            if avg_social < 7:
-                analysis_points.append("challenges in social-emotional and adaptive behavior development")
-            elif avg_social > 13:
-                analysis_points.append("strengths in social-emotional functioning")
-            else:
-                analysis_points.append("typical social-emotional development with some areas for growth")
-        
-        return "; ".join(analysis_points) if analysis_points else "comprehensive developmental evaluation across multiple domains"
-    
-    def _identify_assessment_strengths(self, bayley_cognitive: Dict, bayley_social: Dict) -> str:
-        """Identify strengths from assessment data"""
         strengths = []
-        
-        # Check for cognitive strengths
-        if bayley_cognitive.get("scaled_scores"):
-            for domain, score in bayley_cognitive["scaled_scores"].items():
-                if score >= 10:
-                    strengths.append(f"{domain.lower()}")
-        
-        # Check for social-emotional strengths
-        if bayley_social.get("scaled_scores"):
-            for domain, score in bayley_social["scaled_scores"].items():
-                if score >= 10:
-                    strengths.append(f"{domain.lower()}")
-        
-        return ", ".join(strengths[:3]) if strengths else "emerging developmental skills, social engagement, learning potential"
-    
-    def _identify_assessment_needs(self, bayley_cognitive: Dict, bayley_social: Dict) -> str:
-        """Identify areas of need from assessment data"""
         needs = []
         
-        # Check for cognitive needs
-        if bayley_cognitive.get("scaled_scores"):
-            for domain, score in bayley_cognitive["scaled_scores"].items():
-                if score < 8:
-                    needs.append(f"{domain.lower()}")
-        
-        # Check for social-emotional needs
-        if bayley_social.get("scaled_scores"):
-            for domain, score in bayley_social["scaled_scores"].items():
-                if score < 8:
-                    needs.append(f"{domain.lower()}")
-        
-        return ", ".join(needs[:4]) if needs else "fine motor coordination, attention and focus, communication skills, behavioral regulation"
+        # Cognitive domains first, then social-emotional
+        for assessment, analysis_wording in ((bayley_cognitive, _COGNITIVE_ANALYSIS), (bayley_social, _SOCIAL_ANALYSIS)):
+            if assessment.get("scaled_scores"):
+                avg_score, domain_strengths, domain_needs = _score_profile(assessment["scaled_scores"])
+                analysis_points.append(analysis_wording[_score_bucket(avg_score)])
+                strengths.extend(domain_strengths)
+                needs.extend(domain_needs)
+        
+        return (
+            "; ".join(analysis_points) if analysis_points else "comprehensive developmental evaluation across multiple domains",
+            ", ".join(strengths[:3]) if strengths else "emerging developmental skills, social engagement, learning potential",
+            ", ".join(needs[:4]) if needs else "fine motor coordination, attention and focus, communication skills, behavioral regulation",
+        )
     
-    async def _generate_with_openai(self, prompt: str, max_tokens: int = 500) -> str:
-        """Generate text using OpenAI with clinical context"""
+    async def _generate_with_openai(self, prompt: str, max_tokens: int = 500,
+                                    response_format: Optional[Dict[str, Any]] = None,
+                                    prompt_cache_key: Optional[str] = None) -> str:
+        """Generate text using OpenAI with clinical context; prompt_cache_key names the shared prompt
+        template for provider-side prefix caching"""
         self.logger.info(f"🤖 Generating text with OpenAI (max_tokens: {max_tokens})")
         
         if not self.openai_client:
             self.logger.warning("⚠️ OpenAI client not available, using fallback")
             return await self._generate_fallback_text(prompt)
         
-        # Get configured model
-        model = get_openai_model()
+        # Configured model, resolved once in __init__
+        model = self._model
+        
+        # Prompts are indented triple-quoted strings - the shared margin is whitespace tokens on every line
+        prompt = inspect.cleandoc(prompt)
+        
+        # Only sent when requested, e.g. a json_schema format for structured responses
+        if response_format and response_format["type"] == "json_schema" and not self._structured_outputs:
+            response_format = _JSON_OBJECT_RESPONSE_FORMAT
+        extra_params = {"response_format": response_format} if response_format else {}
+        # Sent as raw body fields so older openai releases without these keywords still work
+        extra_body = {}
+        if self._service_tier:
+            extra_body["service_tier"] = self._service_tier
+        if prompt_cache_key:
+            extra_body["prompt_cache_key"] = f"{_PROMPT_CACHE_NAMESPACE}:{prompt_cache_key}"
+        if extra_body:
+            extra_params["extra_body"] = extra_body
+        if self._service_tier == "flex":
+            extra_params["timeout"] = self.FLEX_REQUEST_TIMEOUT
+        else:
+            extra_params["timeout"] = self.OPENAI_ATTEMPT_TIMEOUT_BASE + max_tokens * self.OPENAI_ATTEMPT_TIMEOUT_PER_TOKEN
+        
+        # Identical prompts (e.g. regenerating a report) are served from the cache
+        cache_key = None
+        if is_prompt_cache_enabled():
+            cache_key = make_cache_key(model, max_tokens, response_format, _SYSTEM_PROMPT, prompt)
+            cached_text = await get_cached_response(
+                self.config.get_prompt_cache_dir(), cache_key, ttl=get_prompt_cache_ttl()
+            )
+            if cached_text is not None:
+                self.logger.info(f"💾 Using cached OpenAI response ({len(cached_text)} characters)")
+                return cached_text
         
         try:
             self.logger.info(f"📡 Sending request to OpenAI API with model: {model}...")
-            response = self.openai_client.chat.completions.create(
+            request = dict(
                 model=model,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a professional pediatric occupational therapist writing clinical evaluation reports. Use sophisticated clinical terminology, evidence-based interpretations, and maintain a professional, objective tone. Base your responses on standard pediatric developmental assessments and best practices in occupational therapy."
+                        "content": _SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -2628,18 +2973,83 @@ class OpenAIEnhancedReportGenerator:
                     }
                 ],
                 max_tokens=max_tokens,
-                temperature=0.3
+                temperature=0.3,
+                **extra_params
             )
-            
-            generated_text = response.choices[0].message.content.strip()
-            self.logger.info(f"✅ OpenAI generation successful ({len(generated_text)} characters)")
+            try:
+                response = await self._create_completion(**request)
+            except _BAD_REQUEST_OPENAI_ERRORS as e:
+                if not response_format or response_format["type"] != "json_schema":
+                    raise
+                # Structured Outputs is model specific - remember the rejection so it costs one 400,
+                # and retry this call in plain JSON mode
+                self.logger.warning(f"⚠️ Model {model} rejected the json_schema response format, "
+                                    f"falling back to json_object: {e}")
+                self._structured_outputs = False
+                request["response_format"] = _JSON_OBJECT_RESPONSE_FORMAT
+                if cache_key is not None:
+                    cache_key = make_cache_key(model, max_tokens, _JSON_OBJECT_RESPONSE_FORMAT, _SYSTEM_PROMPT, prompt)
+                response = await self._create_completion(**request)
+            
+            choice = response.choices[0]
+            generated_text = choice.message.content.strip()
+            
+            # Completion tokens against the budget, so per-section max_tokens can be tuned from logs
+            completion_tokens = response.usage.completion_tokens if response.usage else "?"
+            self.logger.info(f"✅ OpenAI generation successful ({len(generated_text)} characters, "
+                             f"{completion_tokens}/{max_tokens} tokens)")
+            truncated = choice.finish_reason == "length"
+            if truncated:
+                self.logger.warning(f"⚠️ OpenAI response hit max_tokens={max_tokens} and was truncated")
+            
+            # Only complete API responses are cached, never fallback or truncated text
+            if cache_key is not None and not truncated:
+                await set_cached_response(
+                    self.config.get_prompt_cache_dir(), cache_key, generated_text, ttl=get_prompt_cache_ttl()
+                )
             return generated_text
             
+        except _CREDENTIAL_OPENAI_ERRORS as e:
+            # Only this call falls back - the client is kept, so a rotated key or a transient auth
+            # failure does not leave every later report on template text until a restart
+            self.logger.error(f"❌ OpenAI rejected the configured API key - check OPENAI_API_KEY; "
+                              f"this section uses template text: {e}")
+            return await self._generate_fallback_text(prompt)
         except Exception as e:
             self.logger.error(f"❌ OpenAI generation failed: {e}")
             self.logger.info("🔄 Falling back to enhanced template text")
             return await self._generate_fallback_text(prompt)
     
+    async def _create_completion(self, **request):
+        """Chat completion with exponential backoff on timeouts, rate limits and server errors"""
+        # Rough prompt size (about 4 characters per token) plus the completion budget
+        estimated_tokens = request["max_tokens"] + sum(len(m["content"]) for m in request["messages"]) // 4
+        for attempt in range(1, self.OPENAI_MAX_ATTEMPTS + 1):
+            # Every attempt counts against the account limits, retries included
+            await self._rate_limiter.acquire(estimated_tokens)
+            try:
+                # The semaphore is only held while a request is in flight, not during backoff
+                async with self._openai_semaphore:
+                    return await self.openai_client.chat.completions.create(**request)
+            except _RETRYABLE_OPENAI_ERRORS as e:
+                if attempt == self.OPENAI_MAX_ATTEMPTS:
+                    raise
+                # Jitter keeps concurrent sections from retrying in lockstep
+                delay = self.OPENAI_RETRY_BASE_DELAY * 2 ** (attempt - 1) * random.uniform(1.0, 1.5)
+                # A 429 says when the limit resets - retrying sooner would only be rejected again.
+                # The wait is capped at one attempt's timeout, so a server-sent value cannot hold a
+                # report for minutes
+                response = getattr(e, "response", None)
+                retry_after = response.headers.get("retry-after") if response is not None else None
+                if retry_after:
+                    try:
+                        max_delay = request.get("timeout", self.OPENAI_ATTEMPT_TIMEOUT_BASE)
+                        delay = max(delay, min(float(retry_after), max_delay))
+                    except ValueError:
+                        pass
+                self.logger.warning(f"⚠️ OpenAI attempt {attempt} failed ({type(e).__name__}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+    
     async def _generate_consolidated_report_narratives(self, report_data: Dict[str, Any]) -> Dict[str, str]:
         """Generate ALL report narratives in a single OpenAI call to save tokens"""
         patient_info = report_data.get("patient_info", {})
@@ -2651,74 +3061,36 @@ class OpenAIEnhancedReportGenerator:
         extracted_data = report_data.get("extracted_data", {})
         assessment_analysis = report_data.get("assessment_analysis", {})
         
-        consolidated_prompt = f"""
-        Generate ALL sections for a pediatric OT evaluation report for {child_name} (age: {age}). 
-        
-        Patient Info: {child_name}, age {age}, caregiver: {parent_name}
-        Assessment Data: {assessment_analysis}
-        
-        Generate these EXACT sections with clear section markers:
-        
-        [BACKGROUND]
-        Write 2-3 sentences: "A developmental evaluation was recommended by the Regional Center to determine {child_name}'s current level of performance..."
-        
-        [CAREGIVER_CONCERNS]  
-        Write 3-4 sentences about {parent_name}'s concerns regarding {child_name}'s development, attention, fine motor skills, transitions, etc.
-        
-        [OBSERVATIONS]
-        Write 6-8 sentences about {child_name}'s participation in evaluation, muscle tone, attention span, task engagement, assistance needed.
-        
-        [SUMMARY]
-        Write comprehensive 6-8 sentence summary covering assessment findings, strengths, needs, intervention recommendations.
-        
-        [RECOMMENDATIONS]
-        List 4-6 therapy recommendations (PT, ST, OT frequency, early intervention).
-        
-        [GOALS]
-        List 4 specific SMART OT goals with timelines, measurable criteria, assistance levels.
-        
-        Use professional clinical language. Keep each section focused and concise.
-        """
+        # Static instructions first and patient details last, so the provider-side prompt cache
+        # can reuse the identical prefix across reports; keys are sorted for a stable serialization
+        assessment_context = _compact_json(assessment_analysis)
+        consolidated_prompt = (
+            f"{_CONSOLIDATED_INSTRUCTIONS}\n"
+            f"---PATIENT CONTEXT---\n"
+            f"Child: {child_name}\n"
+            f"Age: {age}\n"
+            f"Caregiver: {parent_name}\n"
+            f"Assessment Data: {assessment_context}\n"
+        )
         
         try:
             # Single consolidated OpenAI call instead of 11 separate calls
-            consolidated_response = await self._generate_with_openai(consolidated_prompt, max_tokens=2000)
+            consolidated_response = await self._generate_with_openai(
+                consolidated_prompt,
+                max_tokens=sum(_SECTION_MAX_TOKENS[name] for name in _CONSOLIDATED_SECTIONS),
+                response_format=_CONSOLIDATED_RESPONSE_FORMAT,
+                prompt_cache_key="consolidated",
+            )
             
-            # Parse the response into sections
-            sections = {}
-            current_section = None
-            current_content = []
-            
-            for line in consolidated_response.split('\n'):
-                line = line.strip()
-                if line.startswith('[') and line.endswith(']'):
-                    # Save previous section
-                    if current_section:
-                        sections[current_section] = '\n'.join(current_content).strip()
-                    # Start new section
-                    current_section = line[1:-1].lower()
-                    current_content = []
-                elif line and current_section:
-                    current_content.append(line)
-            
-            # Save last section
-            if current_section:
-                sections[current_section] = '\n'.join(current_content).strip()
-            
-            # Provide fallbacks for missing sections
-            fallback_sections = {
-                'background': f"A developmental evaluation was recommended by the Regional Center to determine {child_name}'s current level of performance and to guide service frequency recommendations for early intervention.",
-                'caregiver_concerns': f"{parent_name} expressed concerns regarding {child_name}'s overall development, including attention span, fine motor skills, and behavioral regulation during transitions.",
-                'observations': f"{child_name} participated in an in-clinic evaluation with cooperative affect but variable attention span. Muscle tone appeared typical with tasks requiring verbal cues and hand-over-hand assistance.",
-                'summary': f"{child_name} (chronological age: {age}) was assessed using standardized pediatric assessment tools. The evaluation revealed areas requiring targeted intervention support through occupational therapy services.",
-                'recommendations': "• Physical Therapy\n• Speech Therapy\n• Occupational Therapy 2x/week\n• Early intervention services",
-                'goals': "1. Within six months, the child will stack 5 blocks independently in 4/5 opportunities with minimal prompts.\n2. Within six months, the child will string 3 beads with moderate assistance in 4/5 opportunities.\n3. Within six months, the child will use pincer grasp for small objects in 4/5 opportunities.\n4. Within six months, the child will scribble on paper spontaneously in 4/5 opportunities."
-            }
+            consolidated_response = await remove_lang_tags(consolidated_response)
+            sections = self._parse_consolidated_response(consolidated_response)
             
-            # Ensure all sections are present
-            for section, fallback in fallback_sections.items():
-                if section not in sections or not sections[section]:
-                    sections[section] = fallback
+            # Ensure all sections are present - fallback text is only built when something is missing
+            missing_sections = [section for section in _CONSOLIDATED_SECTIONS if not sections.get(section)]
+            if missing_sections:
+                fallback_sections = self._get_consolidated_fallbacks(child_name, parent_name, age)
+                for section in missing_sections:
+                    sections[section] = fallback_sections[section]
             
             self.logger.info(f"✅ Generated {len(sections)} report sections in single OpenAI call")
             return sections
@@ -2726,121 +3098,94 @@ class OpenAIEnhancedReportGenerator:
         except Exception as e:
             self.logger.error(f"❌ Consolidated generation failed: {e}")
             # Return all fallbacks
-            return {
-                'background': f"A developmental evaluation was recommended by the Regional Center to determine {child_name}'s current level of performance and to guide service frequency recommendations for early intervention.",
-                'caregiver_concerns': f"{parent_name} expressed concerns regarding {child_name}'s overall development, including attention span, fine motor skills, and behavioral regulation during transitions.",
-                'observations': f"{child_name} participated in an in-clinic evaluation with cooperative affect but variable attention span. Muscle tone appeared typical with tasks requiring verbal cues and hand-over-hand assistance.",
-                'summary': f"{child_name} (chronological age: {age}) was assessed using standardized pediatric assessment tools. The evaluation revealed areas requiring targeted intervention support through occupational therapy services.",
-                'recommendations': "• Physical Therapy\n• Speech Therapy\n• Occupational Therapy 2x/week\n• Early intervention services",
-                'goals': "1. Within six months, the child will stack 5 blocks independently in 4/5 opportunities with minimal prompts.\n2. Within six months, the child will string 3 beads with moderate assistance in 4/5 opportunities.\n3. Within six months, the child will use pincer grasp for small objects in 4/5 opportunities.\n4. Within six months, the child will scribble on paper spontaneously in 4/5 opportunities."
-            }
+            return self._get_consolidated_fallbacks(child_name, parent_name, age)
+    
+    def _parse_consolidated_response(self, consolidated_response: str) -> Dict[str, str]:
+        """Parse the consolidated response - JSON object first, [SECTION] markers as a fallback"""
+        try:
+            parsed = orjson.loads(consolidated_response)
+        except orjson.JSONDecodeError:
+            parsed = None
+        
+        if isinstance(parsed, dict):
+            sections = {}
+            for key, value in parsed.items():
+                # Lists (e.g. recommendations, goals) are flattened to one item per line
+                if isinstance(value, list):
+                    value = "\n".join(str(item) for item in value)
+                sections[str(key).lower()] = str(value).strip()
+            return sections
+        
+        # Single pass over the [SECTION] markers - lines are buffered per section and joined once
+        buffers: Dict[str, List[str]] = {}
+        current_content = None
+        
+        for line in consolidated_response.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            header = _SECTION_HEADER_RE.fullmatch(line)
+            if header:
+                # A repeated header replaces the earlier section, as before
+                current_content = buffers[header.group(1).lower()] = []
+            elif current_content is not None:
+                current_content.append(line)
+        
+        return {
+            section: '\n'.join(content).strip()
+            for section, content in buffers.items()
+            if section
+        }
+    
+    def _get_consolidated_fallbacks(self, child_name: str, parent_name: str, age: str) -> Dict[str, str]:
+        """Fallback text for every consolidated section"""
+        return {
+            'background': f"A developmental evaluation was recommended by the Regional Center to determine {child_name}'s current level of performance and to guide service frequency recommendations for early intervention.",
+            'caregiver_concerns': f"{parent_name} expressed concerns regarding {child_name}'s overall development, including attention span, fine motor skills, and behavioral regulation during transitions.",
+            'observations': f"{child_name} participated in an in-clinic evaluation with cooperative affect but variable attention span. Muscle tone appeared typical with tasks requiring verbal cues and hand-over-hand assistance.",
+            'summary': f"{child_name} (chronological age: {age}) was assessed using standardized pediatric assessment tools. The evaluation revealed areas requiring targeted intervention support through occupational therapy services.",
+            'recommendations': "• Physical Therapy\n• Speech Therapy\n• Occupational Therapy 2x/week\n• Early intervention services",
+            'goals': "1. Within six months, the child will stack 5 blocks independently in 4/5 opportunities with minimal prompts.\n2. Within six months, the child will string 3 beads with moderate assistance in 4/5 opportunities.\n3. Within six months, the child will use pincer grasp for small objects in 4/5 opportunities.\n4. Within six months, the child will scribble on paper spontaneously in 4/5 opportunities."
+        }
     
     async def _generate_fallback_text(self, prompt: str) -> str:
         """Generate enhanced fallback text when OpenAI is not available"""
         self.logger.info("📝 Using enhanced fallback text generation")
         
-        # Extract key context from the prompt to generate better fallback text
-        if "background" in prompt.lower():
-            # Extract patient name and age from prompt
-            patient_name = "the client"
-            if "Patient:" in prompt:
-                try:
-                    patient_name = prompt.split("Patient:")[1].split("(")[0].strip()
-                except:
-                    pass
-            
-            fallback_text = f"A developmental evaluation was recommended by the Regional Center to determine {patient_name}'s current level of performance and to guide service frequency recommendations for early intervention."
-            
-        elif "caregiver concerns" in prompt.lower():
-            # Extract patient and parent information
-            patient_name = "the child"
-            parent_name = "The caregiver"
-            
-            if "Child:" in prompt:
-                try:
-                    patient_name = prompt.split("Child:")[1].split("\n")[0].strip()
-                except:
-                    pass
-            
-            if "Parent/Guardian:" in prompt:
-                try:
-                    parent_name = prompt.split("Parent/Guardian:")[1].split("\n")[0].strip()
-                except:
-                    pass
-            
-            # Enhanced caregiver concerns with specific details
-            fallback_text = f"{parent_name} expressed broad concerns regarding {patient_name}'s overall development. She noted challenges with attention span and focus during structured activities, indicating difficulty with sustained engagement. {parent_name} also reported concerns about fine motor skill development and {patient_name}'s ability to manipulate small objects. Of particular concern is {patient_name}'s communication development and behavioral regulation during transitions between activities."
-            
-        elif "observation" in prompt.lower():
-            # Enhanced clinical observations
-            patient_name = "The child"
-            if "Patient:" in prompt:
-                try:
-                    patient_name = prompt.split("Patient:")[1].split("\n")[0].strip()
-                except:
-                    pass
-            
-            fallback_text = f"{patient_name} participated in an in-clinic evaluation with the caregiver present. {patient_name} presented with a cooperative affect initially but demonstrated variable attention span throughout the assessment. Muscle tone appeared typical for chronological age, with adequate range of motion observed. However, participation was impacted by distractibility and need for frequent redirection. During structured tasks, {patient_name} required verbal and visual cues to maintain engagement. Fine motor coordination showed areas for development, with tasks requiring hand-over-hand assistance for completion. These factors impacted standardized testing and required modifications to maintain participation."
-            
-        elif any(domain in prompt.lower() for domain in ["cognitive", "receptive", "expressive", "fine motor", "gross motor", "social-emotional"]):
-            # Domain-specific enhanced text
-            domain_name = "this domain"
-            for domain in ["Cognitive", "Receptive Communication", "Expressive Communication", "Fine Motor", "Gross Motor", "Social-Emotional"]:
-                if domain.lower() in prompt.lower():
-                    domain_name = domain
-                    break
-            
-            patient_name = "The child"
-            if "Patient:" in prompt:
-                try:
-                    patient_name = prompt.split("Patient:")[1].split("\n")[0].strip()
-                except:
-                    pass
-            
-            # Extract any score information from the prompt
-            score_info = ""
-            if "Scaled Score:" in prompt:
-                try:
-                    score_info = "Assessment scores and clinical observations indicate areas for targeted intervention. "
-                except:
-                    pass
-            
-            fallback_text = f"{patient_name} demonstrated variable performance in {domain_name} during assessment. {score_info}Clinical observations revealed both emerging skills and areas requiring support. During testing activities, {patient_name} showed intermittent engagement with tasks requiring sustained attention and effort. Performance patterns suggest the need for structured intervention to support skill development in this domain. These findings indicate that {patient_name} would benefit from targeted therapeutic intervention."
-            
-        elif "summary" in prompt.lower():
-            # Enhanced comprehensive summary
-            patient_name = "The child"
-            age = "unknown age"
-            
-            if "Patient:" in prompt:
-                try:
-                    patient_name = prompt.split("Patient:")[1].split("(")[0].strip()
-                    age = prompt.split("(")[1].split(")")[0].strip()
-                except:
-                    pass
-            
-            fallback_text = f"{patient_name} (chronological age: {age}) was assessed using multiple standardized pediatric assessment tools to evaluate developmental functioning across cognitive, motor, sensory processing, and adaptive behavior domains. The comprehensive evaluation revealed both areas of emerging strength and areas requiring targeted intervention support. Based on the assessment findings, occupational therapy services are recommended to address identified areas of need and support optimal developmental progression. A collaborative, family-centered approach involving occupational therapy and related services will be beneficial to address the client's comprehensive developmental needs. Regular monitoring and reassessment will be important to track progress and adjust intervention strategies as needed."
-            
-        elif "goals" in prompt.lower():
-            # Enhanced OT goals
-            patient_name = "the child"
-            if "Patient:" in prompt:
-                try:
-                    patient_name = prompt.split("Patient:")[1].split("\n")[0].strip()
-                except:
-                    pass
-            
-            goals = [
-                f"Within six months, {patient_name} will stack 4-5 one-inch blocks independently in 4 out of 5 opportunities with minimal verbal prompts, to improve visual-motor coordination and hand stability for age-appropriate play skills.",
-                f"Within six months, {patient_name} will string 2-3 large beads onto a shoelace in 4 out of 5 opportunities with moderate assistance, demonstrating bilateral hand coordination and crossing midline.",
-                f"Within six months, {patient_name} will use a pincer grasp to pick up and place small objects (cheerios, blocks) in 4 out of 5 opportunities with minimal cues, improving fine motor precision for functional tasks.",
-                f"Within six months, {patient_name} will spontaneously scribble on paper using an age-appropriate grasp in 4 out of 5 opportunities with minimal prompts, promoting pre-writing skill development and creative expression."
-            ]
-            fallback_text = "\n".join([f"{i+1}. {goal}" for i, goal in enumerate(goals)])
-            
-        else:
+        # One scan picks the section from the prompt keywords
+        prompt_lower = prompt.lower()
+        sections = {_FALLBACK_KEYWORD_SECTIONS[keyword] for keyword in _FALLBACK_KEYWORD_RE.findall(prompt_lower)}
+        if not sections:
             # Generic enhanced fallback
-            fallback_text = "Based on comprehensive standardized assessment findings, the client demonstrates a mixed profile of developmental strengths and areas requiring targeted intervention support. Clinical observations and assessment results indicate the need for structured therapeutic intervention to promote optimal developmental outcomes."
+            fallback_text = _GENERIC_FALLBACK_TEXT
+        else:
+            section = min(sections, key=_FALLBACK_SECTION_PRIORITY.index)
+            
+            # Extract key context from the prompt to generate better fallback text - one scan pulls
+            # every labelled field, keeping the first occurrence of each like the old split() chains
+            fields = {}
+            for match in _FALLBACK_FIELD_RE.finditer(prompt):
+                fields.setdefault(match.group(1), match)
+            
+            name_field, default_name = _FALLBACK_NAME_FIELDS[section]
+            name_match = fields.get(name_field)
+            context = {"patient_name": name_match.group(2).strip() if name_match else default_name}
+            
+            if section == "caregiver_concerns":
+                parent = fields.get("Parent/Guardian")
+                context["parent_name"] = parent.group(2).strip() if parent else "The caregiver"
+            elif section == "domain":
+                context["domain_name"] = next(
+                    (domain for domain in _FALLBACK_DOMAINS if domain.lower() in prompt_lower), "this domain"
+                )
+                context["score_info"] = (
+                    "Assessment scores and clinical observations indicate areas for targeted intervention. "
+                    if "Scaled Score:" in prompt else ""
+                )
+            elif section == "summary":
+                context["age"] = name_match.group(3).strip() if name_match and name_match.group(3) else "unknown age"
+            
+            fallback_text = _FALLBACK_TEMPLATES[section].format(**context)
         
         self.logger.info(f"✅ Enhanced fallback text generated ({len(fallback_text)} characters)")
         return fallback_text 
@@ -2888,12 +3233,9 @@ class OpenAIEnhancedReportGenerator:
         """Use consolidated narrative instead of individual OpenAI call"""
         recommendations_text = await self._get_consolidated_narrative(report_data, 'recommendations')
         
-        # Parse into list
-        if "•" in recommendations_text:
-            recommendations = [rec.strip() for rec in recommendations_text.split("•") if rec.strip()]
-        elif "\n" in recommendations_text:
-            recommendations = [rec.strip() for rec in recommendations_text.split("\n") if rec.strip()]
-        else:
+        # The JSON array arrives one item per line; bullets only remain on fallback text
+        recommendations = self._split_list_items(recommendations_text)
+        if not recommendations:
             recommendations = [
                 "Physical Therapy",
                 "Speech Therapy", 
@@ -2903,14 +3245,19 @@ class OpenAIEnhancedReportGenerator:
         
         return recommendations
     
+    @staticmethod
+    def _split_list_items(text: str) -> List[str]:
+        """Split one-item-per-line text into items, dropping any leading bullet or number"""
+        items = (_LIST_MARKER_RE.sub('', line.strip()) for line in text.splitlines())
+        return [item for item in items if item]
+    
     async def _generate_ot_goals_optimized(self, report_data: Dict[str, Any]) -> List[str]:
         """Use consolidated narrative instead of individual OpenAI call"""
         goals_text = await self._get_consolidated_narrative(report_data, 'goals')
         
-        # Parse goals
-        if "Within" in goals_text:
-            goals = [goal.strip() for goal in goals_text.split('\n') if goal.strip() and ('Within' in goal or goal[0].isdigit())]
-        else:
+        # The JSON array arrives one item per line; numbering is dropped since the section renumbers
+        goals = self._split_list_items(goals_text)
+        if not goals:
             goals = [
                 "Within six months, the child will stack 5 blocks independently in 4/5 opportunities with minimal prompts.",
                 "Within six months, the child will string 3 beads with moderate assistance in 4/5 opportunities.",
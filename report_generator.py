@@ -1,3 +1,4 @@
+import asyncio
 import os
 import logging
 from typing import Dict, Any, List, Optional
@@ -80,7 +81,10 @@ class OTReportGenerator:
                 topMargin=1*inch,
                 bottomMargin=1*inch,
                 leftMargin=1*inch,
-                rightMargin=1*inch
+                rightMargin=1*inch,
+                title=f"OT Evaluation Report - {patient_name}",
+                subject="Occupational Therapy Evaluation",
+                creator="OT Report Generator",
             )
             
             # Build content
@@ -103,15 +107,12 @@ class OTReportGenerator:
             story.extend(self._create_recommendations_section(report_data))
             
             # Build PDF
+            # Layout and rendering are CPU-bound - build in a worker thread so the event loop keeps serving
             self.logger.info("🔨 Building PDF document...")
-            doc.build(story)
+            await asyncio.to_thread(doc.build, story)
             
-            # Verify file creation
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path) / 1024 / 1024  # MB
-                self.logger.info(f"✅ Basic report generated successfully: {file_size:.2f} MB")
-            else:
-                raise Exception("PDF file was not created")
+            # doc.build raises if the file can't be written, so no separate existence check is needed
+            self.logger.info(f"✅ Basic report generated successfully: {output_path}")
             
             return output_path
             
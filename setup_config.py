@@ -47,7 +47,7 @@ def setup_openai_config():
     print()
     
     api_key = get_user_input("OpenAI API Key", is_optional=True)
-    model = get_user_input("OpenAI Model", default="gpt-3.5-turbo")
+    model = get_user_input("OpenAI Model", default="gpt-4o-mini")
     
     return {
         'OPENAI_API_KEY': api_key,